@@ -4,11 +4,18 @@ BOM to OWL Converter
 온톨로지 맵핑 및 OWL 저장 전용 스크립트
 """
 
-import xml.etree.ElementTree as ET
+import re
 import sys
+from functools import lru_cache
 
 try:
-    from owlready2 import *
+    # C 기반 lxml 파서가 설치되어 있으면 우선 사용 (API 호환)
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    from owlready2 import AllDifferent
     
     # template.py에서 온톨로지 정의 import
     from template import (
@@ -26,6 +33,40 @@ except ImportError as e:
     print("필요한 패키지들을 설치해주세요: pip install owlready2")
     sys.exit(1)
 
+# 개체 이름 정규화용 변환 테이블 (공백 → 밑줄)
+_SPACE_TBL = str.maketrans({" ": "_"})
+
+# 항상 존재해야 하는 기본 ProcessType (서로 다른 개체로 지정됨)
+_BASE_PROCESS_TYPES = ("Press", "Foaming", "Assemble")
+
+# OWL 저장 형식. "ntriples"는 정렬/들여쓰기 없이 한 줄에 트리플 하나씩 기록해 더 빠르고
+# infer.py(owlready2)에서도 그대로 읽을 수 있지만, Protege 호환을 위해 기본값은 rdfxml 유지
+OWL_SAVE_FORMAT = "rdfxml"
+OWL_WRITE_BUFFER = 1 << 20
+
+# 수치 값에서 단위 문자(s, $, gCO2)를 한 번에 제거하기 위한 정규식
+_UNIT_RE = re.compile(r"s|\$|gCO2")
+
+
+def _iter_mbom_elements(mbom_filename):
+    """
+    M-BOM 파일을 스트리밍 방식으로 파싱하여 Process/Part 요소를 순서대로 반환
+    
+    전체 DOM을 유지하지 않도록 요소 처리가 끝나면 즉시 비워서 메모리를 해제합니다.
+    
+    Args:
+        mbom_filename (str): M-BOM XML 파일 경로
+    
+    Yields:
+        tuple: (태그 이름, 요소)
+    """
+    for _, elem in ET.iterparse(mbom_filename, events=("end",)):
+        tag = elem.tag
+        if tag == "Process" or tag == "Part":
+            yield tag, elem
+            elem.clear()
+
+
 def makeOntology(mbom_filename, ebom_filename):
     """
     E-BOM과 M-BOM 파일을 파싱하여 온톨로지 인스턴스를 생성하고 OWL 형식으로 저장
@@ -47,181 +88,190 @@ def makeOntology(mbom_filename, ebom_filename):
         "Module": {},
         "EBoM": {},
         "Level": {},
-        "Machine": {}
+        "Machine": {},
+        "Quantity": {},
+        "ProcessingTime": {},
+        "Cost": {},
+        "CarbonFootprint": {}
     }
 
-    # 2. E-BOM 파싱
-    print(f"E-BOM 파일 파싱 중: {ebom_filename}")
-    ebom_tree = ET.parse(ebom_filename)
-    ebom_root = ebom_tree.getroot()
-
-    def process_ebom_element(elem, parent_inst=None):
-        """E-BOM 요소를 재귀적으로 처리"""
-        name = elem.findtext("Name", "").strip()
-        level = elem.findtext("Level", "").strip()
+    def _cached_factory(kind, cls, normalize=True):
+        """이름별로 개체를 한 번만 생성하고 instances[kind]에도 등록하는 팩토리 생성"""
+        cache = instances[kind]
+
+        @lru_cache(maxsize=None)
+        def factory(key):
+            inst = cls(key.translate(_SPACE_TBL) if normalize else key)
+            cache[key] = inst
+            return inst
+
+        return factory
+
+    _process_id = _cached_factory("ProcessID", ProcessID, normalize=False)
+    _ptype = _cached_factory("ProcessType", ProcessType)
+    _pdetail = _cached_factory("ProcessDetail", ProcessDetail)
+    _material = _cached_factory("Material", Material)
+    _level = _cached_factory("Level", Level, normalize=False)
+    _quantity = _cached_factory("Quantity", Quantity, normalize=False)
+    _processing_time = _cached_factory("ProcessingTime", ProcessingTime, normalize=False)
+    _cost = _cached_factory("Cost", Cost, normalize=False)
+    _carbon = _cached_factory("CarbonFootprint", CarbonFootprint, normalize=False)
+
+    # 단계 2~8의 개체 생성은 하나의 온톨로지 컨텍스트 안에서 일괄 처리
+    with onto:
+        # 2. E-BOM 파싱
+        print(f"E-BOM 파일 파싱 중: {ebom_filename}")
+        ebom_tree = ET.parse(ebom_filename)
+        ebom_root = ebom_tree.getroot()
+
+        # Assembly 요소부터 명시적 스택으로 깊이 우선 탐색 (재귀 호출/재귀 한도 회피)
+        # 스택 항목: (요소, 부모 인스턴스)
+        _eboms = instances["EBoM"]
+        _modules = instances["Module"]
+        _EBoM, _Module = EBoM, Module
+
+        # Level 이 1 이상인 EBoM 은 중간재 Storage 대상 (탐색 중에 바로 분류, 이름 기준으로 유지)
+        intermediate_targets = {}
+
+        assembly_elem = ebom_root.find("Assembly")
+        stack = [(assembly_elem, None)] if assembly_elem is not None else []
+        while stack:
+            elem, parent_inst = stack.pop()
+            _findtext = elem.findtext
+            name = _findtext("Name", "").strip()
+            level = _findtext("Level", "").strip()
         
-        if not name or not level:
-            return
+            if not name or not level:
+                continue
 
-        # Level 인스턴스 생성 또는 가져오기
-        if level not in instances["Level"]:
-            level_ind = Level(level)
-            instances["Level"][level] = level_ind
-        else:
-            level_ind = instances["Level"][level]
+            # Level 인스턴스 생성 또는 가져오기
+            level_ind = _level(level)
 
-        # Level 0는 Module, 나머지는 EBoM으로 분류
-        if level == "0":
-            obj = Module(name.replace(" ", "_"))
-            instances["Module"][name] = obj
-        else:
-            obj = EBoM(name.replace(" ", "_"))
-            instances["EBoM"][name] = obj
+            # Level 0는 Module, 나머지는 EBoM으로 분류
+            safe_name = name.translate(_SPACE_TBL)
+            if level == "0":
+                obj = _Module(safe_name)
+                _modules[name] = obj
+            else:
+                obj = _EBoM(safe_name)
+                _eboms[name] = obj
+                if level.isdigit() and int(level) > 0:
+                    intermediate_targets[name] = obj
         
-        obj.hasLevel = [level_ind]
-
-        # 부모-자식 관계 설정
-        if parent_inst and isinstance(obj, EBoM) and isinstance(parent_inst, EBoM):
-            parent_inst.hasChildren.append(obj)
-
-        # 하위 Part 요소들 재귀 처리
-        for part_elem in elem.findall("Part"):
-            process_ebom_element(part_elem, parent_inst=obj)
-
-    # Assembly 요소 처리
-    assembly_elem = ebom_root.find("Assembly")
-    if assembly_elem is not None:
-        process_ebom_element(assembly_elem)
-
-    # 3. M-BOM 파싱
-    print(f"M-BOM 파일 파싱 중: {mbom_filename}")
-    mbom_tree = ET.parse(mbom_filename)
-    mbom_root = mbom_tree.getroot()
-
-    # Processes 섹션 처리
-    processes_elem = mbom_root.find("Processes")
-    if processes_elem is not None:
-        for process_elem in processes_elem.findall("Process"):
-            pid = process_elem.get("id", "").strip()
-            ptype = process_elem.findtext("ProcessType", "").strip()
-            pdetail = process_elem.findtext("ProcessDetail", "").strip()
-            material = process_elem.findtext("Material", "").strip()
-            part_name = process_elem.findtext("PartName", "").strip()
-            pre_refs = process_elem.findall("PrecedingProcesses/ProcessRef")
-
-            # ProcessID 인스턴스 생성
-            if pid not in instances["ProcessID"]:
-                proc_ind = ProcessID(pid)
-                instances["ProcessID"][pid] = proc_ind
+            obj.hasLevel = [level_ind]
+
+            # 부모-자식 관계 설정
+            if parent_inst and isinstance(obj, _EBoM) and isinstance(parent_inst, _EBoM):
+                parent_inst.hasChildren.append(obj)
+
+            # 하위 Part 요소들은 문서 순서대로 처리되도록 역순으로 스택에 추가
+            stack.extend((part_elem, obj) for part_elem in reversed(elem.findall("Part")))
+
+        # E-BOM 파싱 이후에는 EBoM/Module 이 더 이상 추가되지 않으므로
+        # 이름 → 인스턴스 조회용 통합 인덱스를 한 번만 구성 (동일 이름이면 EBoM 우선)
+        part_index = {**instances["Module"], **instances["EBoM"]}
+
+        # 3. M-BOM 파싱
+        print(f"M-BOM 파일 파싱 중: {mbom_filename}")
+        # Process/Part 요소는 스트리밍으로 한 번만 읽고, 이후 단계에서 재사용할 수 있도록
+        # Process는 (pid, ptype, pdetail, material, part_name, components, pre_refs),
+        # Part는 (name, qty, time, cost, carbon) 튜플로 캐시
+        processes_cache = []
+        parts_cache = []
+        for tag, elem in _iter_mbom_elements(mbom_filename):
+            if tag == "Process":
+                processes_cache.append((
+                    elem.get("id", "").strip(),
+                    elem.findtext("ProcessType", "").strip(),
+                    elem.findtext("ProcessDetail", "").strip(),
+                    elem.findtext("Material", "").strip(),
+                    elem.findtext("PartName", "").strip(),
+                    [c.text.strip() for c in elem.findall("Components/ComponentName")],
+                    [r.text.strip() for r in elem.findall("PrecedingProcesses/ProcessRef")],
+                ))
             else:
-                proc_ind = instances["ProcessID"][pid]
+                # 자식 요소를 한 번만 순회하여 태그 → 텍스트 dict 구성
+                vals = {child.tag: child.text or "" for child in elem}
+                parts_cache.append((
+                    vals.get("Name", "").strip(),
+                    vals.get("Quantity", "").strip(),
+                    vals.get("ProcessTime", "").strip(),
+                    vals.get("ProcessCost", "").strip(),
+                    vals.get("CarbonFootprint", "").strip(),
+                ))
+
+        # Processes 섹션 처리
+        for pid, ptype, pdetail, material, part_name, components, pre_refs in processes_cache:
+            # ProcessID 인스턴스 생성
+            proc_ind = _process_id(pid)
 
             # ProcessType 연결
             if ptype:
-                if ptype not in instances["ProcessType"]:
-                    ptype_ind = ProcessType(ptype.replace(" ", "_"))
-                    instances["ProcessType"][ptype] = ptype_ind
-                else:
-                    ptype_ind = instances["ProcessType"][ptype]
-                proc_ind.hasProcessType = [ptype_ind]
+                proc_ind.hasProcessType = [_ptype(ptype)]
 
             # ProcessDetail 연결
-            if pdetail and pdetail not in instances["ProcessDetail"]:
-                detail_ind = ProcessDetail(pdetail.replace(" ", "_"))
-                instances["ProcessDetail"][pdetail] = detail_ind
+            if pdetail:
+                _pdetail(pdetail)
 
             # Material 연결 (특정 프로세스 타입에만)
             if ptype in ["Press", "Foaming", "assemble"] and material:
-                if material not in instances["Material"]:
-                    mat_ind = Material(material.replace(" ", "_"))
-                    instances["Material"][material] = mat_ind
-                else:
-                    mat_ind = instances["Material"][material]
-                proc_ind.hasMaterial = [mat_ind]
+                proc_ind.hasMaterial = [_material(material)]
 
             # Assembly 타입 프로세스의 컴포넌트 연결
             if ptype.lower() == "assemble":
-                comp_elems = process_elem.findall("Components/ComponentName")
-                for comp_elem in comp_elems:
-                    comp_name = comp_elem.text.strip()
+                for comp_name in components:
                     if comp_name in instances["EBoM"]:
                         comp_inst = instances["EBoM"][comp_name]
                         proc_ind.hasComponents.append(comp_inst)
 
             # 선행 프로세스 연결
             preceding_inds = []
-            for pre_ref_elem in pre_refs:
-                pre_ref = pre_ref_elem.text.strip()
+            for pre_ref in pre_refs:
                 # N/A도 포함하여 처리
-                if pre_ref not in instances["ProcessID"]:
-                    pre_ind = ProcessID(pre_ref)
-                    instances["ProcessID"][pre_ref] = pre_ind
-                else:
-                    pre_ind = instances["ProcessID"][pre_ref]
-                preceding_inds.append(pre_ind)
-            
+                preceding_inds.append(_process_id(pre_ref))
+        
             if preceding_inds:
                 proc_ind.hasPrecedingProcess = preceding_inds
 
             # ProcessID → EBoM 또는 Module 연결 (hasProductName)
             if part_name:
-                part_inst = instances["EBoM"].get(part_name) or instances["Module"].get(part_name)
+                part_inst = part_index.get(part_name)
                 if part_inst:
                     proc_ind.hasProductName = [part_inst]
 
-    # 4. Parts 섹션의 속성 연결
-    parts_elem = mbom_root.find("Parts")
-    if parts_elem is not None:
-        for part in parts_elem.findall("Part"):
-            name = part.findtext("Name", "").strip()
-            qty = part.findtext("Quantity", "").strip()
-            time = part.findtext("ProcessTime", "").strip()
-            cost = part.findtext("ProcessCost", "").strip()
-            carbon = part.findtext("CarbonFootprint", "").strip()
-
+        # 4. Parts 섹션의 속성 연결
+        for name, qty, time, cost, carbon in parts_cache:
             if name in instances["EBoM"]:
                 ebom_inst = instances["EBoM"][name]
 
+                # 같은 값의 수치 개체는 값별로 하나만 생성하여 재사용
                 if qty:
-                    qty_inst = Quantity(qty.replace("s", "").replace("$", "").replace("gCO2", ""))
-                    ebom_inst.hasQuantity = [qty_inst]
+                    ebom_inst.hasQuantity = [_quantity(_UNIT_RE.sub("", qty))]
 
                 if time:
-                    time_inst = ProcessingTime(time.replace("s", ""))
-                    ebom_inst.hasProcessingTime = [time_inst]
+                    ebom_inst.hasProcessingTime = [_processing_time(time.replace("s", ""))]
 
                 if cost:
-                    cost_inst = Cost(cost.replace("$", ""))
-                    ebom_inst.hasCost = [cost_inst]
+                    ebom_inst.hasCost = [_cost(cost.replace("$", ""))]
 
                 if carbon:
-                    carbon_inst = CarbonFootprint(carbon.replace("gCO2", ""))
-                    ebom_inst.hasCarbonFootprint = [carbon_inst]
-    
- 
-    # 5. ProcessType 간 서로 다른 개체 지정
-    process_types = ["Press", "Foaming", "Assemble"]
-    for pt in process_types:
-        if pt not in instances["ProcessType"]:
-            instances["ProcessType"][pt] = ProcessType(pt)
+                    ebom_inst.hasCarbonFootprint = [_carbon(carbon.replace("gCO2", ""))]
 
-    
+        # 5. ProcessType 간 서로 다른 개체 지정
+        for pt in _BASE_PROCESS_TYPES:
+            _ptype(pt)
 
-    # 서로 다른 개체로 명시
-    different_individuals = list(instances["ProcessType"].values())
-    if len(different_individuals) > 1:
-        AllDifferent(different_individuals)
+        # 서로 다른 개체로 명시 (같은 개체가 여러 키로 등록된 경우를 대비해 중복 제거 후 한 번만 호출)
+        different_individuals = list({id(v): v for v in instances["ProcessType"].values()}.values())
+        if len(different_individuals) > 1:
+            AllDifferent(different_individuals)
 
-    # 6. ProcessDetail → Machine 연결 (최소 수정)
-    if processes_elem is not None:
-        for process_elem in processes_elem.findall("Process"):
-            pid = process_elem.get("id", "").strip()
-            detail = process_elem.findtext("ProcessDetail", "").strip()
-        
+        # 6. ProcessDetail → Machine 연결 (최소 수정)
+        for pid, _, detail, *_ in processes_cache:
             if pid in instances["ProcessID"] and detail in instances["ProcessDetail"]:
                 proc_inst = instances["ProcessID"][pid]
                 detail_inst = instances["ProcessDetail"][detail]
-                
+            
                 # 기존 연결이 있는지 확인 후 추가 (덮어쓰기 방지)
                 if hasattr(detail_inst, 'isMachineOf') and detail_inst.isMachineOf:
                     # 이미 연결된 프로세스가 있다면 추가
@@ -231,58 +281,61 @@ def makeOntology(mbom_filename, ebom_filename):
                     # 첫 번째 연결
                     detail_inst.isMachineOf = [proc_inst]
 
-    # 7. hasChildren 관계 정의 - Assemble 타입 Process에 대해
-    if processes_elem is not None:
-        for process_elem in processes_elem.findall("Process"):
-            process_type = process_elem.findtext("ProcessType", "").strip().lower()
-            if process_type == "assemble":
-                parent_name = process_elem.findtext("PartName", "").strip()
-                component_elems = process_elem.findall("Components/ComponentName")
-                
-                if parent_name in instances["EBoM"] or parent_name in instances["Module"]:
-                    parent_inst = instances["EBoM"].get(parent_name) or instances["Module"].get(parent_name)
-                    for comp_elem in component_elems:
-                        comp_name = comp_elem.text.strip()
-                        if comp_name in instances["EBoM"] or comp_name in instances["Module"]:
-                            child_inst = instances["EBoM"].get(comp_name) or instances["Module"].get(comp_name)
-                            if child_inst not in parent_inst.hasChildren:
-                                parent_inst.hasChildren.append(child_inst)
-
-    # 8. Storage 생성 및 isStorageOf 연결
-    raw_material_storage_targets = []
-    intermediate_storage_targets = []
-    finished_goods_storage_targets = []
-
-    # EBoM 인스턴스 분류
-    for name, inst in instances["EBoM"].items():
-        if inst.hasLevel:
-            level_name = str(inst.hasLevel[0].name)
-            if level_name.isdigit() and int(level_name) > 0:
-                intermediate_storage_targets.append(inst)
-
-    # Material 인스턴스는 raw material storage에
-    raw_material_storage_targets.extend(instances["Material"].values())
-
-    # Module 인스턴스는 finished goods storage에
-    finished_goods_storage_targets.extend(instances["Module"].values())
-
-    # Storage 인스턴스 생성 및 연결
-    for i, target in enumerate(intermediate_storage_targets):
-        storage_inst = Storage(f"I_Storage_{i}")
-        storage_inst.isStorageOf = [target]
-
-    for i, target in enumerate(raw_material_storage_targets):
-        storage_inst = Storage(f"R_Storage_{i}")
-        storage_inst.isStorageOf = [target]
-
-    for i, target in enumerate(finished_goods_storage_targets):
-        storage_inst = Storage(f"F_Storage_{i}")
-        storage_inst.isStorageOf = [target]
+        # 7. hasChildren 관계 정의 - Assemble 타입 Process에 대해
+        # 부모별 자식 집합(중복 검사)과 순서 리스트를 파이썬 측에서 관리하고,
+        # 마지막에 부모마다 한 번만 hasChildren 을 기록
+        children_map = {}
+        children_order = {}
+        for _, process_type, _, _, parent_name, component_names, _ in processes_cache:
+            if process_type.lower() == "assemble":
+                parent_inst = part_index.get(parent_name)
+                if parent_inst is not None:
+                    if parent_inst not in children_map:
+                        # E-BOM 단계에서 이미 연결된 자식을 유지
+                        existing = list(parent_inst.hasChildren)
+                        children_order[parent_inst] = existing
+                        children_map[parent_inst] = set(existing)
+                    seen = children_map[parent_inst]
+                    order = children_order[parent_inst]
+                    for comp_name in component_names:
+                        child_inst = part_index.get(comp_name)
+                        if child_inst is not None and child_inst not in seen:
+                            seen.add(child_inst)
+                            order.append(child_inst)
+
+        for parent_inst, children in children_order.items():
+            parent_inst.hasChildren = children
+
+        # 8. Storage 생성 및 isStorageOf 연결
+        raw_material_storage_targets = []
+        finished_goods_storage_targets = []
+
+        # EBoM 인스턴스 분류는 E-BOM 탐색 중에 완료됨
+        intermediate_storage_targets = list(intermediate_targets.values())
+
+        # Material 인스턴스는 raw material storage에
+        raw_material_storage_targets.extend(instances["Material"].values())
+
+        # Module 인스턴스는 finished goods storage에
+        finished_goods_storage_targets.extend(instances["Module"].values())
+
+        # Storage 인스턴스 생성 및 연결 (접두어별 대상 목록을 한 루프에서 처리)
+        storage_groups = (
+            ("I", intermediate_storage_targets),
+            ("R", raw_material_storage_targets),
+            ("F", finished_goods_storage_targets),
+        )
+        for prefix, targets in storage_groups:
+            for i, target in enumerate(targets):
+                if target is not None:
+                    Storage(f"{prefix}_Storage_{i}").isStorageOf = [target]
 
     # 9. 온톨로지 OWL 형식으로 저장
     print("온톨로지를 OWL 형식으로 저장 중...")
     output_file = "onto/generated_bom.owl"
-    onto.save(file=output_file, format="rdfxml")
+    # 1MB 버퍼의 바이너리 핸들로 저장하여 쓰기 시스템 호출 횟수를 줄임
+    with open(output_file, "wb", buffering=OWL_WRITE_BUFFER) as f:
+        onto.save(file=f, format=OWL_SAVE_FORMAT)
     
     print(f"✅ 온톨로지가 OWL 형식으로 저장되었습니다: {output_file}")
     
@@ -1,121 +1,218 @@
+import os
+import csv
+import hashlib
+from collections import defaultdict
 from owlready2 import *
 import pandas as pd
-from typing import List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+
+
+# ALBBA_REASONER 환경 변수로 추론기를 선택합니다. (pellet | hermit, 기본값: pellet)
+REASONER = os.environ.get("ALBBA_REASONER", "pellet").lower()
+if REASONER not in ("pellet", "hermit"):
+    raise ValueError(f"지원하지 않는 추론기입니다: {REASONER} (pellet 또는 hermit)")
+
+# ALBBA_EXPLAIN=1 일 때만 빈칸 사유를 계산해 기입합니다. (진단용, 기본값: 0)
+EXPLAIN = os.environ.get("ALBBA_EXPLAIN", "0") == "1"
+
+# 추론된 온톨로지 저장 형식 (rdfxml → inferred_bom.owl, ntriples → inferred_bom.nt, 기본값: rdfxml)
+INFERRED_EXT = {"rdfxml": "owl", "ntriples": "nt"}
+INFERRED_FORMAT = os.environ.get("ALBBA_INFERRED_FORMAT", "rdfxml").lower()
+if INFERRED_FORMAT not in INFERRED_EXT:
+    raise ValueError(f"지원하지 않는 저장 형식입니다: {INFERRED_FORMAT} (rdfxml 또는 ntriples)")
+
+INPUT_OWL = "onto/generated_bom.owl"
+CACHE_DIR = "onto/.cache"
+CACHE_KEEP = 5  # 보관할 추론 결과 캐시 개수 (최근 사용 순)
+
+
+def _input_digest(path: str) -> str:
+    """입력 OWL 파일 내용, 추론기 종류, 이 스크립트(infer.py) 내용으로 캐시 키를 만든다.
+
+    SWRL 규칙과 _link_connected_to()가 이 파일에 정의되어 있으므로,
+    규칙이 바뀌면 캐시 키도 바뀌어 이전 추론 결과를 재사용하지 않는다.
+    """
+    h = hashlib.blake2b(REASONER.encode(), digest_size=16)
+    for src in (__file__, path):
+        with open(src, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _evict_cache(keep: int = CACHE_KEEP) -> None:
+    """최근 사용된 keep개를 제외한 캐시 파일을 삭제한다."""
+    files = sorted(
+        (os.path.join(CACHE_DIR, n) for n in os.listdir(CACHE_DIR) if n.endswith(".nt")),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for path in files[keep:]:
+        os.remove(path)
+
+
+def _link_connected_to() -> None:
+    """창고 <-> 설비 연결(connectedTo)을 자원 기준 해시 조인으로 추가한다.
+
+    - Rule 9: 창고 hasOutput(자원) & 설비 hasInput(같은 자원) -> connectedTo(창고, 설비)
+    - Rule 10: 설비 hasOutput(자원) & 창고 hasInput(같은 자원) -> connectedTo(설비, 창고) (isMachineOf가 있는 설비만)
+    """
+    storage_out, storage_in = defaultdict(list), defaultdict(list)
+    machine_in, machine_out = defaultdict(list), defaultdict(list)
+    for s in onto.Storage.instances():
+        for mat in s.hasOutput:
+            storage_out[mat].append(s)
+        for mat in s.hasInput:
+            storage_in[mat].append(s)
+    for m in onto.Machine.instances():
+        for mat in m.hasInput:
+            machine_in[mat].append(m)
+        if m.isMachineOf:
+            for mat in m.hasOutput:
+                machine_out[mat].append(m)
+
+    with onto:
+        for sources, targets in ((storage_out, machine_in), (machine_out, storage_in)):
+            for mat, srcs in sources.items():
+                dsts = targets.get(mat)
+                if not dsts:
+                    continue
+                for src in srcs:
+                    linked = set(src.connectedTo)
+                    for dst in dsts:
+                        if dst not in linked:
+                            src.connectedTo.append(dst)
+                            linked.add(dst)
 
 
 # 1. 기존 온톨로지 로딩
-# template에서 onto 객체를 가져온 후, Individuals가 저장된 파일을 로드합니다.
-onto = get_ontology("onto/generated_bom.owl").load()
-
-# 2. SWRL 규칙 정의
-with onto:
-    # Rule 1: 원재료 창고의 Input
-    rule1 = Imp()
-    rule1.set_as_rule("""
-        Storage(?s), Material(?m), isStorageOf(?s, ?m) -> hasInput(?s, ?m)
-    """)
-
-    # Rule 2: 원재료 창고의 Output
-    rule2 = Imp()
-    rule2.set_as_rule("""
-        Storage(?s), Material(?m), isStorageOf(?s, ?m) -> hasOutput(?s, ?m)
-    """)
-
-    # Rule 3: 부품 창고의 Input
-    rule3 = Imp()
-    rule3.set_as_rule("""
-        Storage(?s), EBoM(?m), isStorageOf(?s, ?m) -> hasInput(?s, ?m)
-    """)
-
-    # Rule 4: 부품 창고의 Output
-    rule4 = Imp()
-    rule4.set_as_rule("""
-        Storage(?s), EBoM(?m), isStorageOf(?s, ?m) -> hasOutput(?s, ?m)
-    """)
-
-    # Rule 5: 공정 결과(result) 추론
-    rule5 = Imp()
-    rule5.set_as_rule("""
-        ProcessID(?p), hasProductName(?p, ?e) -> result(?p, ?e)
-    """)
-
-    # Rule 6: 조립 공정이 아닌 설비의 Input 추론
-    rule6 = Imp()
-    rule6.set_as_rule("""
-        ProcessID(?p), Machine(?m), isMachineOf(?m, ?p), hasProcessType(?p, ?pt), differentFrom(?pt, Assemble), hasMaterial(?p, ?mat) -> hasInput(?m, ?mat)
-    """)
-
-    # Rule 7: 조립 공정의 Input 추론
-    rule7 = Imp()
-    rule7.set_as_rule("""
-        ProcessID(?p), Machine(?m), isMachineOf(?m, ?p), hasProcessType(?p, Assemble), hasComponents(?p, ?comp) -> hasInput(?m, ?comp)
-    """)
-
-    # Rule 8: 설비의 Output 추론
-    rule8 = Imp()
-    rule8.set_as_rule("""
-        Machine(?m), ProcessID(?p), isMachineOf(?m, ?p), result(?p, ?prod) -> hasOutput(?m, ?prod)
-    """)
-
-    # Rule 9: 창고 -> 설비 연결(connectedTo) 추론
-    rule9 = Imp()
-    rule9.set_as_rule("""
-        Storage(?s), Machine(?m), hasOutput(?s, ?mat), hasInput(?m, ?mat) -> connectedTo(?s, ?m)
-    """)
-
-    # Rule 10: 설비 -> 창고 연결(connectedTo) 추론 (조립 공정 제외)
-    rule10 = Imp()
-    rule10.set_as_rule("""
-        Machine(?m), Storage(?s), hasOutput(?m, ?mat), hasInput(?s, ?mat), isMachineOf(?m, ?p), hasProcessType(?p, ?pt), differentFrom(?pt, Assemble) -> connectedTo(?m, ?s)
-    """)
-
-    # Rule 11: 조립 설비 -> 창고 연결(connectedTo) 추론
-    rule11 = Imp()
-    rule11.set_as_rule("""
-        Machine(?m), Storage(?s), hasOutput(?m, ?mat), hasInput(?s, ?mat), isMachineOf(?m, ?p), hasProcessType(?p, ?pt), sameAs(?pt, Assemble) -> connectedTo(?m, ?s)
-    """)
-
-    # Rule 12: 시뮬레이션 파라미터 추론
-    rule12 = Imp()
-    rule12.set_as_rule("""
-        hasQuantity(?prod, ?q), hasProductName(?p, ?prod), ProcessID(?p), hasCarbonFootprint(?prod, ?cf), isMachineOf(?m, ?p), hasProcessingTime(?prod, ?pt), hasCost(?prod, ?c), hasProcessType(?p, ?pty) -> hasCarbonFootprintSim(?m, ?cf), hasCostSim(?m, ?c), hasProcessingTimeSim(?m, ?pt), hasOutputQuantity(?m, ?q), hasInputQuantity(?m, ?q), hasProcessTypeSim(?m, ?pty)
-    """)
-
-    # Rule 13: 설비의 Process Type 추론
-    rule13 = Imp()
-    rule13.set_as_rule("""
-        Machine(?m), ProcessID(?p), hasProcessType(?p, ?pt), isMachineOf(?m, ?p) -> hasProcessTypeSim(?m, ?pt)
-    """)
-
-
-# 3. Pellet 추론기 실행
-print("Pellet 추론기를 실행합니다...")
-with onto:
-    sync_reasoner_pellet(infer_property_values=True, infer_data_property_values=True)
-print("추론이 완료되었습니다.")
-
-# 4. 추론 결과를 DataFrame으로 생성 (Simulation 인스턴스 중심)
-report = []
+# 입력 파일이 바뀌지 않았다면 이전 추론 결과(onto/.cache/{hash}.nt)를 그대로 사용합니다.
+# 캐시는 내부용이므로 XML보다 쓰기/읽기가 가벼운 N-Triples로 저장합니다.
+cache_file = os.path.join(CACHE_DIR, f"{_input_digest(INPUT_OWL)}.nt")
+cache_hit = os.path.exists(cache_file)
+if cache_hit:
+    os.utime(cache_file)
+    onto = get_ontology(cache_file).load()
+    print(f"캐시된 추론 결과를 사용합니다: {cache_file}")
+else:
+    # template에서 onto 객체를 가져온 후, Individuals가 저장된 파일을 로드합니다.
+    onto = get_ontology(INPUT_OWL).load()
+
+if not cache_hit:
+    # 2. SWRL 규칙 정의
+    # 전제는 선택도가 높은 속성 atom을 앞에 두고, template.py의 domain/range로 이미 보장되는
+    # 클래스 atom(예: isMachineOf → Machine/ProcessID)은 생략합니다.
+    with onto:
+        # Rule 1: 원재료 창고의 Input/Output
+        rule1 = Imp()
+        rule1.set_as_rule("""
+            isStorageOf(?s, ?m), Material(?m) -> hasInput(?s, ?m), hasOutput(?s, ?m)
+        """)
+
+        # Rule 3: 부품 창고의 Input/Output
+        rule3 = Imp()
+        rule3.set_as_rule("""
+            isStorageOf(?s, ?m), EBoM(?m) -> hasInput(?s, ?m), hasOutput(?s, ?m)
+        """)
+
+        # Rule 5(공정 결과 result)는 template.py에서 hasProductName을 result의 하위 속성으로 선언해 대체
+
+        # Rule 6: 조립 공정이 아닌 설비의 Input 추론
+        rule6 = Imp()
+        rule6.set_as_rule("""
+            isMachineOf(?m, ?p), hasMaterial(?p, ?mat), hasProcessType(?p, ?pt), differentFrom(?pt, Assemble) -> hasInput(?m, ?mat)
+        """)
+
+        # Rule 7: 조립 공정의 Input 추론
+        rule7 = Imp()
+        rule7.set_as_rule("""
+            hasProcessType(?p, Assemble), isMachineOf(?m, ?p), hasComponents(?p, ?comp) -> hasInput(?m, ?comp)
+        """)
+
+        # Rule 8: 설비의 Output 추론
+        rule8 = Imp()
+        rule8.set_as_rule("""
+            isMachineOf(?m, ?p), result(?p, ?prod) -> hasOutput(?m, ?prod)
+        """)
+
+        # Rule 9/10(창고 <-> 설비 connectedTo)은 추론 후 _link_connected_to()에서 계산
+
+        # Rule 12: 시뮬레이션 파라미터 추론
+        rule12 = Imp()
+        rule12.set_as_rule("""
+            isMachineOf(?m, ?p), hasProductName(?p, ?prod), hasQuantity(?prod, ?q), hasCarbonFootprint(?prod, ?cf), hasProcessingTime(?prod, ?pt), hasCost(?prod, ?c) -> hasCarbonFootprintSim(?m, ?cf), hasCostSim(?m, ?c), hasProcessingTimeSim(?m, ?pt), hasOutputQuantity(?m, ?q), hasInputQuantity(?m, ?q)
+        """)
+
+        # Rule 13: 설비의 Process Type 추론 (제품 속성이 없어도 공정 타입만으로 적용)
+        rule13 = Imp()
+        rule13.set_as_rule("""
+            isMachineOf(?m, ?p), hasProcessType(?p, ?pt) -> hasProcessTypeSim(?m, ?pt)
+        """)
+
+    # 3. 추론기 실행
+    print(f"{REASONER.capitalize()} 추론기를 실행합니다...")
+    with onto:
+        if REASONER == "hermit":
+            # HermiT은 데이터 속성값 추론을 지원하지 않음
+            sync_reasoner_hermit(infer_property_values=True)
+        else:
+            # template.py의 속성은 모두 ObjectProperty이므로 데이터 속성값 추론은 끈다
+            sync_reasoner_pellet(infer_property_values=True, infer_data_property_values=False)
+    print("추론이 완료되었습니다.")
+    _link_connected_to()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    onto.save(file=cache_file, format="ntriples")
+    _evict_cache()
+
+# 4. 추론 결과를 CSV로 기록 (Simulation 인스턴스 중심)
+
+# 리포트에서 참조하는 클래스를 한 번만 조회해 둔다 (인스턴스마다 onto 네임스페이스 조회 방지)
+PROP_CACHE = {name: getattr(onto, name, None) for name in ("Machine", "Storage")}
+
+
+def _prefetch_object_triples() -> Dict[int, Dict[str, List[Any]]]:
+    """추론이 끝난 quadstore의 객체 속성 트리플을 한 번에 읽어
+    {주어 storid: {속성명: [값 엔티티, ...]}} 사전으로 만든다."""
+    world = onto.world
+    prop_names = {prop.storid: prop.python_name for prop in world.object_properties()}
+    get_entity = world._get_by_storid
+    by_subject = {}
+    for s, p, o in world._get_obj_triples_spo_spo(None, None, None):
+        name = prop_names.get(p)
+        if name is None:
+            continue
+        by_subject.setdefault(s, {}).setdefault(name, []).append(get_entity(o))
+    return by_subject
+
+
+# 이후 리포트 작성은 quadstore를 다시 조회하지 않고 이 사전만 사용한다
+TRIPLES_BY_SUBJECT = _prefetch_object_triples()
 
 # --------- 헬퍼 함수들 ---------
-def _get_prop_values(inst, prop_name: str) -> List[Any]:
-    """onto의 prop_name 속성값을 리스트로 반환. 값이 엔티티면 .name으로 치환하지 않고 원본을 유지.
-    빈 경우 [] 반환, 속성 미존재 시 [] 반환."""
-    prop = getattr(onto, prop_name, None)
-    if not prop:
-        return []
-    try:
-        return list(prop[inst])
-    except Exception:
-        return []
+def _iter_prop_values(inst, prop_name: str) -> Iterator[Any]:
+    """미리 읽어 둔 트리플에서 prop_name 속성값을 순회 (리스트를 새로 만들지 않음)."""
+    return iter(TRIPLES_BY_SUBJECT.get(getattr(inst, "storid", None), {}).get(prop_name, ()))
+
 
+def _has_prop(inst, prop_name: str) -> bool:
+    """prop_name 속성값이 하나라도 있는지 여부."""
+    return next(_iter_prop_values(inst, prop_name), None) is not None
 
-def _names(values: List[Any]) -> List[str]:
+
+def _first_prop(inst, prop_name: str) -> Optional[Any]:
+    """prop_name의 첫 번째 속성값 (없으면 None)."""
+    return next(_iter_prop_values(inst, prop_name), None)
+
+
+def _names(values: Iterable[Any]) -> List[str]:
     return [v.name if hasattr(v, "name") else str(v) for v in values]
 
 
 def _is_instance_of(inst, class_name: str) -> bool:
-    cls = getattr(onto, class_name, None)
+    cls = PROP_CACHE.get(class_name)
+    if cls is None:
+        cls = PROP_CACHE[class_name] = getattr(onto, class_name, None)
     if not cls:
         return False
     try:
@@ -126,122 +223,142 @@ def _is_instance_of(inst, class_name: str) -> bool:
 
 
 def _is_assemble_proc(p) -> bool:
-    pt_vals = _get_prop_values(p, "hasProcessType")
-    pts = {n.lower() for n in _names(pt_vals)}
-    return ("assemble" in pts) or ("assembly" in pts)
+    return any(n.lower() in ("assemble", "assembly") for n in _names(_iter_prop_values(p, "hasProcessType")))
 
 
-def _exists_name(values: List[Any], target: str) -> bool:
+def _exists_name(values: Iterable[Any], target: str) -> bool:
     return any((getattr(v, "name", str(v)) == target) for v in values)
 
 
-def _reason_for_missing(inst, prop_name: str) -> str:
-    """빈칸 사유를 SWRL 규칙 전제 충족 여부로 설명을 생성한다."""
+def _instance_features(inst) -> Dict[str, Any]:
+    """빈칸 사유 판정에 쓰이는 전제(feature)들을 인스턴스당 한 번만 계산한다."""
     is_machine = _is_instance_of(inst, "Machine")
-    is_storage = _is_instance_of(inst, "Storage")
-
+    p = _first_prop(inst, "isMachineOf")
+    prod = _first_prop(p, "hasProductName")
+
+    if is_machine:
+        role = "machine_assemble" if p is not None and _is_assemble_proc(p) else "machine"
+    elif _is_instance_of(inst, "Storage"):
+        role = "storage"
+    else:
+        role = "other"
+
+    return {
+        "role": role,
+        "has_proc": p is not None,
+        "has_storage_of": _has_prop(inst, "isStorageOf"),
+        "has_output": _has_prop(inst, "hasOutput"),
+        "p_has_process_type": _has_prop(p, "hasProcessType"),
+        "p_has_product_name": prod is not None,
+        "p_has_result": _has_prop(p, "result"),
+        "p_has_material": _has_prop(p, "hasMaterial"),
+        "p_has_components": _has_prop(p, "hasComponents"),
+        "p_has_preceding": _has_prop(p, "hasPrecedingProcess"),
+        "p_preceding_na": _exists_name(_iter_prop_values(p, "hasPrecedingProcess"), "N/A"),
+        "prod_has_time": _has_prop(prod, "hasProcessingTime"),
+        "prod_has_cost": _has_prop(prod, "hasCost"),
+        "prod_has_cf": _has_prop(prod, "hasCarbonFootprint"),
+        "prod_has_qty": _has_prop(prod, "hasQuantity"),
+        "prod": getattr(prod, "name", str(prod)),
+    }
+
+
+# --------- 빈칸 사유 결정 테이블 ---------
+# (속성, 역할) -> 순서대로 검사할 (feature, 미충족 시 사유) 목록. feature가 None이면 무조건 해당 사유.
+_ROLES = ("machine", "machine_assemble", "storage", "other")
+_SIM_PROPS = ("hasProcessingTimeSim", "hasCostSim", "hasCarbonFootprintSim", "hasOutputQuantity", "hasInputQuantity", "hasProcessTypeSim")
+_SIM_PROD_CHECKS = {
+    "hasProcessingTimeSim": ("prod_has_time", "Rule12 미충족: hasProcessingTime({prod}) 없음"),
+    "hasCostSim": ("prod_has_cost", "Rule12 미충족: hasCost({prod}) 없음"),
+    "hasCarbonFootprintSim": ("prod_has_cf", "Rule12 미충족: hasCarbonFootprint({prod}) 없음"),
+    "hasOutputQuantity": ("prod_has_qty", "Rule12 미충족: hasQuantity({prod}) 없음"),
+    "hasInputQuantity": ("prod_has_qty", "Rule12 미충족: hasQuantity({prod}) 없음"),
+}
+_NOT_TARGET_CLASS = ((None, "대상 클래스 판별 불가"),)
+
+REASON_TABLE = {}
+for _role in _ROLES:
     # 공통
-    if prop_name in ("isMachineOf", "isStorageOf"):
-        return "기본 매핑 누락(원본 온톨로지에서 생성되지 않음)"
-
-    # 시뮬레이션 파라미터들 (Rule12/Rule13)
-    if prop_name in ("hasProcessingTimeSim", "hasCostSim", "hasCarbonFootprintSim", "hasOutputQuantity", "hasInputQuantity", "hasProcessTypeSim"):
-        if not is_machine:
-            return "대상 아님: 설비(Machine)가 아님(Rule12 비적용)"
-        p_vals = _get_prop_values(inst, "isMachineOf")
-        if not p_vals:
-            return "Rule12 미충족: isMachineOf 누락 → 공정 정보 부재"
-        p = p_vals[0]
-        # Rule13 대체 경로(공정 타입만)
-        if prop_name == "hasProcessTypeSim":
-            if not _get_prop_values(p, "hasProcessType"):
-                return "Rule12/13 미충족: hasProcessType 누락"
-            # 나머지 전제가 부족하면 Rule12는 실패하지만 Rule13만으로는 채워질 수 있음
-            return "Rule12 일부 전제 부족 가능. Rule13 충족 시 추론되어야 함"
-        # 나머지 파라미터는 제품(product) 속성 의존
-        prod_vals = _get_prop_values(p, "hasProductName")
-        if not prod_vals:
-            return "Rule12 미충족: hasProductName 누락 → result/제품 속성 접근 불가"
-        prod = prod_vals[0]
-        if prop_name == "hasProcessingTimeSim" and not _get_prop_values(prod, "hasProcessingTime"):
-            return f"Rule12 미충족: hasProcessingTime({getattr(prod, 'name', str(prod))}) 없음"
-        if prop_name == "hasCostSim" and not _get_prop_values(prod, "hasCost"):
-            return f"Rule12 미충족: hasCost({getattr(prod, 'name', str(prod))}) 없음"
-        if prop_name == "hasCarbonFootprintSim" and not _get_prop_values(prod, "hasCarbonFootprint"):
-            return f"Rule12 미충족: hasCarbonFootprint({getattr(prod, 'name', str(prod))}) 없음"
-        if prop_name in ("hasOutputQuantity", "hasInputQuantity") and not _get_prop_values(prod, "hasQuantity"):
-            return f"Rule12 미충족: hasQuantity({getattr(prod, 'name', str(prod))}) 없음"
-        # 모든 전제가 있는 것 같은데 값이 비어있다면 일반 메시지
-        return "Rule12 전제는 보이지만 추론 결과 없음(규칙/데이터 정합 확인 필요)"
-
+    REASON_TABLE[("isMachineOf", _role)] = ((None, "기본 매핑 누락(원본 온톨로지에서 생성되지 않음)"),)
+    REASON_TABLE[("isStorageOf", _role)] = ((None, "기본 매핑 누락(원본 온톨로지에서 생성되지 않음)"),)
+    for _prop in _SIM_PROPS:
+        if not _role.startswith("machine"):
+            REASON_TABLE[(_prop, _role)] = ((None, "대상 아님: 설비(Machine)가 아님(Rule12 비적용)"),)
+        elif _prop == "hasProcessTypeSim":
+            # 설비의 Process Type (Rule13: 공정 타입만 있으면 추론됨)
+            REASON_TABLE[(_prop, _role)] = (
+                ("has_proc", "Rule12 미충족: isMachineOf 누락 → 공정 정보 부재"),
+                ("p_has_process_type", "Rule12/13 미충족: hasProcessType 누락"),
+                (None, "Rule12 일부 전제 부족 가능. Rule13 충족 시 추론되어야 함"),
+            )
+        else:
+            # 시뮬레이션 파라미터들 (Rule12)
+            REASON_TABLE[(_prop, _role)] = (
+                ("has_proc", "Rule12 미충족: isMachineOf 누락 → 공정 정보 부재"),
+                ("p_has_product_name", "Rule12 미충족: hasProductName 누락 → result/제품 속성 접근 불가"),
+                _SIM_PROD_CHECKS[_prop],
+                (None, "Rule12 전제는 보이지만 추론 결과 없음(규칙/데이터 정합 확인 필요)"),
+            )
+
+REASON_TABLE.update({
     # hasInput
-    if prop_name == "hasInput":
-        if is_machine:
-            p_vals = _get_prop_values(inst, "isMachineOf")
-            if not p_vals:
-                return "Rule6/7 미충족: isMachineOf 누락"
-            p = p_vals[0]
-            if _is_assemble_proc(p):
-                if not _get_prop_values(p, "hasComponents"):
-                    return "Rule7 미충족: hasComponents 없음(조립 공정)"
-                return "Rule7 적용 대상이나 입력 구성요소-자원 매칭 부재"
-            else:
-                if not _get_prop_values(p, "hasMaterial"):
-                    return "Rule6 미충족: hasMaterial 없음(비-조립 공정)"
-                prec = _get_prop_values(p, "hasPrecedingProcess")
-                if not prec:
-                    return "Rule6 미충족: hasPrecedingProcess 없음(비-조립 공정)"
-                if not _exists_name(prec, "N/A"):
-                    return "Rule6 미충족: hasPrecedingProcess ≠ 'N/A'"
-                return "Rule6 전제는 보이지만 입력-자원 매칭 부재"
-        if is_storage:
-            if not _get_prop_values(inst, "isStorageOf"):
-                return "Rule1/3 미충족: isStorageOf 누락"
-            return "Rule1/3 전제는 보이지만 타입/매칭 불일치"
-        return "대상 클래스 판별 불가"
-
+    ("hasInput", "machine"): (
+        ("has_proc", "Rule6/7 미충족: isMachineOf 누락"),
+        ("p_has_material", "Rule6 미충족: hasMaterial 없음(비-조립 공정)"),
+        ("p_has_preceding", "Rule6 미충족: hasPrecedingProcess 없음(비-조립 공정)"),
+        ("p_preceding_na", "Rule6 미충족: hasPrecedingProcess ≠ 'N/A'"),
+        (None, "Rule6 전제는 보이지만 입력-자원 매칭 부재"),
+    ),
+    ("hasInput", "machine_assemble"): (
+        ("p_has_components", "Rule7 미충족: hasComponents 없음(조립 공정)"),
+        (None, "Rule7 적용 대상이나 입력 구성요소-자원 매칭 부재"),
+    ),
+    ("hasInput", "storage"): (
+        ("has_storage_of", "Rule1/3 미충족: isStorageOf 누락"),
+        (None, "Rule1/3 전제는 보이지만 타입/매칭 불일치"),
+    ),
+    ("hasInput", "other"): _NOT_TARGET_CLASS,
     # hasOutput
-    if prop_name == "hasOutput":
-        if is_machine:
-            p_vals = _get_prop_values(inst, "isMachineOf")
-            if not p_vals:
-                return "Rule8 미충족: isMachineOf 누락"
-            p = p_vals[0]
-            if not _get_prop_values(p, "hasProductName"):
-                return "Rule5 미충족: hasProductName 누락 → result 부재"
-            res = _get_prop_values(p, "result")
-            if not res:
-                return "Rule5 미적용: result 생성 실패"
-            return "Rule8 전제는 보이지만 출력-제품 매핑 부재"
-        if is_storage:
-            if not _get_prop_values(inst, "isStorageOf"):
-                return "Rule2/4 미충족: isStorageOf 누락(창고)"
-            return "Rule2/4 전제는 보이지만 타입/매칭 불일치"
-        return "대상 클래스 판별 불가"
-
+    ("hasOutput", "machine"): (
+        ("has_proc", "Rule8 미충족: isMachineOf 누락"),
+        ("p_has_product_name", "Rule8 미충족: hasProductName 누락 → result 부재"),
+        ("p_has_result", "Rule8 미충족: result(hasProductName 상위 속성) 추론 실패"),
+        (None, "Rule8 전제는 보이지만 출력-제품 매핑 부재"),
+    ),
+    ("hasOutput", "storage"): (
+        ("has_storage_of", "Rule1/3 미충족: isStorageOf 누락(창고)"),
+        (None, "Rule1/3 전제는 보이지만 타입/매칭 불일치"),
+    ),
+    ("hasOutput", "other"): _NOT_TARGET_CLASS,
     # connectedTo
-    if prop_name == "connectedTo":
-        if is_machine:
-            outs = _get_prop_values(inst, "hasOutput")
-            if not outs:
-                return "Rule10/11 미충족: hasOutput 없음(설비)"
-            p_vals = _get_prop_values(inst, "isMachineOf")
-            if not p_vals:
-                return "Rule10/11 미충족: isMachineOf 누락"
-            p = p_vals[0]
-            if _is_assemble_proc(p):
-                return "Rule11 미적용: 대응 창고의 hasInput(동일 자원) 없음"
-            else:
-                return "Rule10 미적용: 대응 창고의 hasInput(동일 자원) 없음"
-        if is_storage:
-            outs = _get_prop_values(inst, "hasOutput")
-            if not outs:
-                return "Rule9 미충족: Storage hasOutput 없음"
-            return "Rule9 미적용: 대응 설비의 hasInput(동일 자원) 없음"
-        return "대상 클래스 판별 불가"
-
-    # 기본
-    return "값 없음: 규칙 전제 미충족 또는 적용 대상 아님"
+    ("connectedTo", "machine"): (
+        ("has_output", "Rule10 미충족: hasOutput 없음(설비)"),
+        ("has_proc", "Rule10 미충족: isMachineOf 누락"),
+        (None, "Rule10 미적용: 대응 창고의 hasInput(동일 자원) 없음"),
+    ),
+    ("connectedTo", "storage"): (
+        ("has_output", "Rule9 미충족: Storage hasOutput 없음"),
+        (None, "Rule9 미적용: 대응 설비의 hasInput(동일 자원) 없음"),
+    ),
+    ("connectedTo", "other"): _NOT_TARGET_CLASS,
+})
+# 조립 공정 여부는 hasInput에서만 사유가 갈리므로 나머지는 일반 설비와 동일
+REASON_TABLE.setdefault(("hasOutput", "machine_assemble"), REASON_TABLE[("hasOutput", "machine")])
+REASON_TABLE.setdefault(("connectedTo", "machine_assemble"), REASON_TABLE[("connectedTo", "machine")])
+
+
+def _reason_for_missing(inst, prop_name: str, feat: Optional[Dict[str, Any]] = None) -> str:
+    """빈칸 사유를 SWRL 규칙 전제 충족 여부로 설명을 생성한다.
+    feat를 넘기면 인스턴스 전제 계산을 재사용한다."""
+    if feat is None:
+        feat = _instance_features(inst)
+    checks = REASON_TABLE.get((prop_name, feat["role"]))
+    if checks is None:
+        # 기본
+        return "값 없음: 규칙 전제 미충족 또는 적용 대상 아님"
+    for key, message in checks:
+        if key is None or not feat[key]:
+            return message.format(prod=feat["prod"])
 
 
 TARGET_COLS = [
@@ -257,52 +374,77 @@ TARGET_COLS = [
     "isMachineOf",
     "isStorageOf",
 ]
+TARGET_COLS_SET = frozenset(TARGET_COLS)
+
+PREVIEW_ROWS = 10
+# Excel에서 열 CSV가 필요할 때만 BOM(utf-8-sig)을 붙입니다. (ALBBA_CSV_EXCEL 설정 시)
+CSV_ENCODING = "utf-8-sig" if os.environ.get("ALBBA_CSV_EXCEL") else "utf-8"
+
+
+def _build_entry(inst) -> Dict[str, Any]:
+    entry = {"name": inst.name, "type": "Simulation"}
+
+    # 1) 우선 현재 인스턴스에 존재하는 속성값을 수집
+    present_props = {
+        prop_name: [v.name if hasattr(v, "name") else v for v in values]
+        for prop_name, values in TRIPLES_BY_SUBJECT.get(inst.storid, {}).items()
+    }
+
+    # 2) 타깃 컬럼을 모두 보장하고, 빈칸이라면 사유를 채움 (EXPLAIN일 때만, 전제는 인스턴스당 한 번만 계산)
+    feat = None
+    for col in TARGET_COLS:
+        if col in present_props and present_props[col]:
+            entry[col] = present_props[col]
+        elif EXPLAIN:
+            # 원본 값이 비어있거나 아예 없는 경우 → 사유 기입
+            if feat is None:
+                feat = _instance_features(inst)
+            reason = _reason_for_missing(inst, col, feat)
+            entry[col] = reason
+        else:
+            entry[col] = ""
+
+    # 3) 그 외 존재하는 속성도 담되, 이미 TARGET_COLS에 있는 것은 건너뜀
+    for k, v in present_props.items():
+        if k not in TARGET_COLS_SET:
+            entry[k] = v
 
-if hasattr(onto, "Simulation"):
-    for inst in onto.Simulation.instances():
-        entry = {"name": inst.name, "type": "Simulation"}
-
-        # 1) 우선 현재 인스턴스에 존재하는 속성값을 수집
-        present_props = {}
-        for prop in inst.get_properties():
-            try:
-                values = [v.name if hasattr(v, "name") else v for v in prop[inst]]
-            except Exception:
-                values = []
-            present_props[prop.python_name] = values
-
-        # 2) 타깃 컬럼을 모두 보장하고, 빈칸이라면 사유를 채움
-        for col in TARGET_COLS:
-            if col in present_props and present_props[col]:
-                entry[col] = present_props[col]
-            else:
-                # 원본 값이 비어있거나 아예 없는 경우 → 사유 기입
-                reason = _reason_for_missing(inst, col)
-                entry[col] = reason
-
-        # 3) 그 외 존재하는 속성도 담되, 이미 TARGET_COLS에 있는 것은 건너뜀
-        for k, v in present_props.items():
-            if k not in TARGET_COLS:
-                entry[k] = v
-
-        report.append(entry)
-else:
+    # 리스트 값을 보기 좋게 문자열로 변환
+    return {k: repr(v) if isinstance(v, list) else v for k, v in entry.items()}
+
+
+instances = list(onto.Simulation.instances()) if hasattr(onto, "Simulation") else None
+if instances is None:
     print("❌ 'Simulation' 클래스가 온톨로지에 존재하지 않습니다.")
 
-df = pd.DataFrame(report)
-if not df.empty:
-    # 리스트 값을 보기 좋게 문자열로 변환
-    for col in df.columns:
-        df[col] = df[col].apply(lambda x: repr(x) if isinstance(x, list) else x)
+if instances:
+    # TARGET_COLS 외의 속성 컬럼은 미리 읽어 둔 트리플에서 결정한다
+    extra_cols = sorted({
+        prop_name
+        for inst in instances
+        for prop_name in TRIPLES_BY_SUBJECT.get(inst.storid, {})
+        if prop_name not in TARGET_COLS_SET
+    })
     csv_path = "onto/inference_result.csv"
-    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-    print(f"추론 리포트를 '{csv_path}'로 저장했습니다. (행 수: {len(df)})")
-    print("상위 10행 미리보기:")
-    print(df.head(10))
+    preview = []
+    n_rows = 0
+    # 행을 만들자마자 바로 기록한다 (전체 리포트를 메모리에 모으지 않음)
+    with open(csv_path, "w", newline="", encoding=CSV_ENCODING) as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "type", *TARGET_COLS, *extra_cols], lineterminator="\n")
+        writer.writeheader()
+        # 행 생성은 미리 읽어 둔 사전만 다루는 순수 Python 작업이므로 스레드 없이 순서대로 처리한다
+        for entry in map(_build_entry, instances):
+            writer.writerow(entry)
+            if n_rows < PREVIEW_ROWS:
+                preview.append(entry)
+            n_rows += 1
+    print(f"추론 리포트를 '{csv_path}'로 저장했습니다. (행 수: {n_rows})")
+    print(f"상위 {PREVIEW_ROWS}행 미리보기:")
+    print(pd.DataFrame(preview))
 else:
     print("수집된 추론 결과가 없습니다.")
 
 # 5. 추론된 온톨로지 저장
-output_file = "onto/inferred_bom.owl"
-onto.save(file=output_file, format="rdfxml")
+output_file = f"onto/inferred_bom.{INFERRED_EXT[INFERRED_FORMAT]}"
+onto.save(file=output_file, format=INFERRED_FORMAT)
 print(f"추론된 온톨로지가 '{output_file}' 파일로 저장되었습니다.")
\ No newline at end of file
@@ -59,8 +59,13 @@ with onto:
         domain = [ProcessID]
         range = [Material]
         
+    # 공정 결과 (hasProductName의 상위 속성 → 별도 SWRL 규칙 없이 result가 추론됨)
+    class result(ObjectProperty):
+        domain = [ProcessID]
+        range = [EBoM]
+
      # Processes - 품명        
-    class hasProductName(ObjectProperty): # ( productname -> hasProductName로 수정 )
+    class hasProductName(result): # ( productname -> hasProductName로 수정 )
         domain = [ProcessID]
         range = [EBoM]  
         
@@ -99,10 +104,6 @@ with onto:
         range = [CarbonFootprint]
 
     # 시뮬레이션 클래스를 위한 Object Properties
-    class result(ObjectProperty):
-        domain = [ProcessID]
-        range = [EBoM]
-        
     class connectedTo(ObjectProperty):
         domain = [Component]
         range = [Component]
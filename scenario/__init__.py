@@ -1 +1,10 @@
 """Scenario package for manufacturing simulation framework."""
+
+import os
+import sys
+
+# 패키지로 임포트될 때 프로젝트 루트를 한 번만 모듈 검색 경로에 등록
+# (여러 시나리오를 함께 임포트해도 sys.path 가 중복으로 늘어나지 않도록 함)
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
@@ -12,40 +12,143 @@
 import os
 import sys
 from datetime import datetime
+from types import MappingProxyType
 
-# 프로젝트 루트를 파이썬 모듈 검색 경로에 추가
+# 프로젝트 루트를 파이썬 모듈 검색 경로에 추가 (이미 등록된 경우 중복 삽입하지 않음)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # 간단한 로깅 프레임워크 가져오기
 from src.utils.log_util import LogContext, log_execution, quick_log
 
-import simpy
-from src.core.simulation_engine import SimulationEngine
-from src.core.resource_manager import AdvancedResourceManager
-from src.core.report_manager import ReportManager
-from src.core.material_supply_manager import MaterialSupplyManager, SupplyRoute, SupplyStrategy
-from src.Resource.machine import Machine
-from src.Resource.transport import Transport
-from src.Resource.buffer import Buffer
-from src.Resource.product import Product
-from src.Resource.resource_base import Resource, ResourceType
-from src.Processes.manufacturing_process import ManufacturingProcess
-from src.Processes.assembly_process import AssemblyProcess
-from src.Processes.quality_control_process import QualityControlProcess
-from src.Processes.transport_process import TransportProcess
-from src.Flow.multi_group_flow import MultiProcessGroup
-from src.Flow.process_chain import ProcessChain
-
-def create_refrigerator_scenario():
-    """냉장고 제조공정 시나리오의 모든 자원과 프로세스를 생성합니다."""
+# simpy와 시뮬레이션 프레임워크(src.core, src.Resource, src.Processes, src.Flow)는
+# 시나리오를 실제로 생성할 때만 필요하므로 함수 안에서 지연 import
+# (모듈을 불러오기만 하는 경우 프레임워크 전체를 적재하지 않음)
+
+# Unit3에서 같은 최종조립로봇을 쓰는 연속 공정(본체조립~최종마감)을 하나의 공정으로 합칠지 여부
+# (1이면 사이 컨베이어 운송 4개가 사라지고 그 시간은 병합 공정 처리 시간에 포함됨.
+#  컨베이어 대기가 없어지므로 시뮬레이션 결과가 달라짐)
+FUSE_U3_SERIAL = os.environ.get("ALBBA_FUSE_U3") == "1"
+
+# 설비 청사진: 그룹 → (ID 접두어, 이름 접두어, 처리 시간)
+# 실행마다 바뀌지 않는 설정이므로 모듈 수준에 두고 재사용
+_MACHINE_BLUEPRINTS = {
+    'press': ('PRESS_M', '프레스기계', 1),
+    'assembly': ('ASSEMBLY_R', '도어조립로봇', 25),
+    'filling': ('FILLING_M', '발포충진기', 50),
+    'final_assembly': ('FINAL_R', '최종조립로봇', 20),
+    'inspection': ('INSPECT_M', '품질검사기', 15),
+}
+
+
+# AGV 운송 구간: (구간 키, 이름 접두어) - ID는 AGV_<키 대문자>_L<라인>
+_AGV_STAGES = (
+    ('u1_b1', 'Unit1→Buffer1'),
+    ('b1_assy', 'Buffer1→조립'),
+    ('assy_b2', '조립→Buffer2'),
+    ('b2_fill', 'Buffer2→충진'),
+    ('fill_b3', '충진→Buffer3'),
+    ('b3_u3', 'Buffer3→Unit3'),
+)
+
+
+# TransportProcess 공용 인자 (프로세스가 값을 복사해 사용하므로 공유해도 안전, 읽기 전용으로 취급)
+_EMPTY = {}  # 읽기 전용
+_EMPTY_LIST = ()
+# (적재, 운송, 하역, 쿨다운) 시간
+AGV_T = (1.0, 3.0, 1.0, 0.5)
+CONV_T_PALLET = (0, 1.5, 0, 0)  # 팰릿버퍼 → Unit1(Blanking) 컨베이어
+CONV_T_U1 = (0, 2.0, 0, 0)
+CONV_T_U3 = (0, 1.5, 0, 0)
+
+# Unit3 최종조립로봇 연속 공정(본체조립, 힌지결합, 도어결합, 기능부품결합, 최종마감) 처리 시간
+_U3_ROBOT_TIMES = (20, 15, 15, 20, 10)
+# 병합 공정 처리 시간: 로봇 공정 합 + 생략되는 사이 컨베이어 4구간의 사이클 시간(적재+운송+하역)
+_U3_FUSED_TIME = sum(_U3_ROBOT_TIMES) + 4 * sum(CONV_T_U3[:3])
+
+
+# 원자재 시트 공통 자재 보충 설정
+MATERIAL_CFG = {
+    'default_quantity': 30,
+    'min_threshold': 10,
+    'warning_threshold': 20,
+    'supply_time': 2.0,
+}
+
+# Unit1 프레스 라인별 부품: (라인 이름, 입력 시트 ID, 출력 패널 ID)
+_PART_INFO = (
+    ("SidePanel", 'R_SIDE_S', 'R_SIDE_P'),
+    ("BackSheet", 'R_BACK_S', 'R_BACK_P'),
+    ("TopCover", 'R_TOP_S', 'R_TOP_P'),
+    ("TopSupport", 'R_SUPPORT_S', 'R_SUPPORT_P'),
+)
+
+# 라인별 운송 프로세스 ID/이름 테이블 (모듈 로드 시 한 번만 생성, [라인][구간] 순서)
+_U1_STEPS = (('BD', 'Blanking→Drawing'), ('DP', 'Drawing→Piercing'))
+_U1_IDS = tuple(tuple(f'T_U1_L{i}_{code}' for code, _ in _U1_STEPS) for i in range(4))
+_U1_NAMES = tuple(tuple(f'Unit1-라인{i}-{label}운송' for _, label in _U1_STEPS) for i in range(4))
+_U3_STEPS = (
+    ('MH', '본체조립→힌지결합'),
+    ('HD', '힌지결합→도어결합'),
+    ('DF', '도어결합→기능부품결합'),
+    ('FF', '기능부품결합→최종마감'),
+    ('FI', '최종마감→품질검사'),
+)
+_U3_IDS = tuple(tuple(f'T_U3_L{i}_{code}' for code, _ in _U3_STEPS) for i in range(4))
+_U3_NAMES = tuple(tuple(f'Unit3-라인{i}-{label}운송' for _, label in _U3_STEPS) for i in range(4))
+# AGV 구간 운송 프로세스: 구간 키 → 라인별 ID/이름 (ID는 T_<키 대문자>_L<라인>)
+_AGV_IDS = {key: tuple(f'T_{key.upper()}_L{i}' for i in range(4)) for key, _ in _AGV_STAGES}
+_AGV_NAMES = {key: tuple(f'{label}-라인{i}-운송' for i in range(4)) for key, label in _AGV_STAGES}
+# 공정간 컨베이어 ID/이름 (라인 i, 컨베이어 j → 인덱스 i*컨베이어수+j)
+_U1_CONV_IDS = tuple(f'CONV_U1_L{i}_{j+1}' for i in range(4) for j in range(2))
+_U1_CONV_NAMES = tuple(f'Unit1-라인{i}-컨베이어{j+1}' for i in range(4) for j in range(2))
+_U3_CONV_IDS = tuple(f'CONV_U3_L{i}_{j+1}' for i in range(4) for j in range(5))
+_U3_CONV_NAMES = tuple(f'Unit3-라인{i}-컨베이어{j+1}' for i in range(4) for j in range(5))
+
+
+def _build_machine_group(env, group, count=4):
+    """청사진으로 첫 기계를 만들고 나머지 라인 기계는 clone_for로 복제합니다."""
+    from src.Resource.machine import Machine
+    
+    id_prefix, name_prefix, processing_time = _MACHINE_BLUEPRINTS[group]
+    template = Machine(env, f'{id_prefix}1', f'{name_prefix}1', capacity=1, processing_time=processing_time)
+    return [template] + [template.clone_for(env, f'{id_prefix}{i}', f'{name_prefix}{i}') for i in range(2, count + 1)]
+
+
+def create_refrigerator_scenario(verbose: bool = True):
+    """냉장고 제조공정 시나리오의 모든 자원과 프로세스를 생성합니다.
+    
+    Args:
+        verbose: 운송 시스템 구성 요약 출력 여부 (반복 실행 시 False로 생략)
+    """
+    
+    import simpy
+    from src.core.simulation_engine import SimulationEngine
+    from src.core.resource_manager import AdvancedResourceManager
+    from src.core.material_supply_manager import MaterialSupplyManager, SupplyRoute, SupplyStrategy
+    from src.Resource.machine import Machine
+    from src.Resource.transport import Transport
+    from src.Resource.buffer import Buffer
+    from src.Resource.product import Product
+    from src.Resource.resource_base import ResourceType
+    from src.Processes.manufacturing_process import ManufacturingProcess
+    from src.Processes.assembly_process import AssemblyProcess
+    from src.Processes.quality_control_process import QualityControlProcess
+    from src.Processes.transport_process import TransportProcess
+    from src.Flow.multi_group_flow import MultiProcessGroup
+    from src.Flow.process_chain import ProcessChain
     
     env = simpy.Environment()
     engine = SimulationEngine(env)
     resource_manager = AdvancedResourceManager(env)
     
+    # 공정 생성이 반복되는 본문에서 전역 이름 조회 대신 지역 변수를 사용
+    _MP, _AP, _QC, _TP = ManufacturingProcess, AssemblyProcess, QualityControlProcess, TransportProcess
+    _rm = resource_manager
+    
     # --- 1. 자원(Resource) 등록 ---
-    resource_manager.register_resource("transport", capacity=10, resource_type=ResourceType.TRANSPORT)
+    _rm.register_resource("transport", capacity=10, resource_type=ResourceType.TRANSPORT)
 
     # --- 2. 제품(Product) 및 부품(Resource) 정의 ---
     side_panel_sheet = Product('R_SIDE_S', 'SidePanelSheet', '사이드패널시트', resource_type=ResourceType.RAW_MATERIAL)
@@ -76,23 +179,20 @@ def create_refrigerator_scenario():
     pallet_buffers = [side_panel_pallet_buffer, back_sheet_pallet_buffer, top_cover_pallet_buffer, lower_cover_pallet_buffer]
 
     # --- 3. 설비(Machine) 정의 (완전 자동화 공정) ---
-    press_machines = [Machine(env, f'PRESS_M{i}', f'프레스기계{i}', capacity=1, processing_time=1) for i in range(1, 5)]
+    press_machines = _build_machine_group(env, 'press')
 
-    assembly_robots = [Machine(env, f'ASSEMBLY_R{i}', f'도어조립로봇{i}', capacity=1, processing_time=25) for i in range(1, 5)]
-    filling_machines = [Machine(env, f'FILLING_M{i}', f'발포충진기{i}', capacity=1, processing_time=50) for i in range(1, 5)]
+    assembly_robots = _build_machine_group(env, 'assembly')
+    filling_machines = _build_machine_group(env, 'filling')
 
-    final_assembly_robots = [Machine(env, f'FINAL_R{i}', f'최종조립로봇{i}', capacity=1, processing_time=20) for i in range(1, 5)]
-    inspection_machines = [Machine(env, f'INSPECT_M{i}', f'품질검사기{i}', capacity=1, processing_time=15) for i in range(1, 5)]
+    final_assembly_robots = _build_machine_group(env, 'final_assembly')
+    inspection_machines = _build_machine_group(env, 'inspection')
     
     # 자재창고 설비 (자동화)
     warehouse_equipment = [Machine(env, 'WAREHOUSE_M1', '자재창고장비', capacity=1, processing_time=2.0)]
     
-    # 자재창고 -> 팰릿버퍼 보충용 AGV (각 버퍼당 1대씩, 총 4대)
-    agv_warehouse_side = Transport(env, 'AGV_WH_SIDE', '창고→사이드팰릿-AGV', capacity=5, transport_speed=2.0, transport_type="agv")
-    agv_warehouse_back = Transport(env, 'AGV_WH_BACK', '창고→백시트팰릿-AGV', capacity=5, transport_speed=2.0, transport_type="agv")
-    agv_warehouse_top = Transport(env, 'AGV_WH_TOP', '창고→탑커버팰릿-AGV', capacity=5, transport_speed=2.0, transport_type="agv")
-    agv_warehouse_lower = Transport(env, 'AGV_WH_LOWER', '창고→로워커버팰릿-AGV', capacity=5, transport_speed=2.0, transport_type="agv")
-    warehouse_agvs = [agv_warehouse_side, agv_warehouse_back, agv_warehouse_top, agv_warehouse_lower]
+    # 자재창고 -> 팰릿버퍼 보충용 AGV (팰릿버퍼 4개가 함께 쓰는 AGV 풀 1개, 용량 4)
+    # 4개 보충 경로가 공유하는 AGV 풀 (경로별 보충은 한 번에 한 대만 사용하므로 용량 4로 충분)
+    agv_warehouse_pool = Transport(env, 'AGV_WH_POOL', '창고→팰릿-AGV풀', capacity=4, transport_speed=2.0, transport_type="agv")
     
     # 팰릿버퍼 -> Unit1공정 연결용 컨베이어 (각 버퍼당 1대씩, 총 4대)
     conv_pallet_to_unit1_side = Transport(env, 'CONV_PALLET_SIDE', '사이드팰릿→Unit1-컨베이어', capacity=10, transport_speed=1.5, transport_type="conveyor")
@@ -101,63 +201,22 @@ def create_refrigerator_scenario():
     conv_pallet_to_unit1_lower = Transport(env, 'CONV_PALLET_LOWER', '로워커버팰릿→Unit1-컨베이어', capacity=10, transport_speed=1.5, transport_type="conveyor")
     pallet_to_unit1_conveyors = [conv_pallet_to_unit1_side, conv_pallet_to_unit1_back, conv_pallet_to_unit1_top, conv_pallet_to_unit1_lower]
     
-    # Unit1 -> Buffer1 AGV (각 라인당 1대씩, 총 4대)
-    agv_u1_b1_l1 = Transport(env, 'AGV_U1_B1_L1', 'Unit1→Buffer1-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_u1_b1_l2 = Transport(env, 'AGV_U1_B1_L2', 'Unit1→Buffer1-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_u1_b1_l3 = Transport(env, 'AGV_U1_B1_L3', 'Unit1→Buffer1-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_u1_b1_l4 = Transport(env, 'AGV_U1_B1_L4', 'Unit1→Buffer1-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_u1_b1 = [agv_u1_b1_l1, agv_u1_b1_l2, agv_u1_b1_l3, agv_u1_b1_l4]
-    
-    # Buffer1 -> Assembly AGV (각 라인당 1대씩, 총 4대)
-    agv_b1_assy_l1 = Transport(env, 'AGV_B1_ASSY_L1', 'Buffer1→조립-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b1_assy_l2 = Transport(env, 'AGV_B1_ASSY_L2', 'Buffer1→조립-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b1_assy_l3 = Transport(env, 'AGV_B1_ASSY_L3', 'Buffer1→조립-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b1_assy_l4 = Transport(env, 'AGV_B1_ASSY_L4', 'Buffer1→조립-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_b1_assy = [agv_b1_assy_l1, agv_b1_assy_l2, agv_b1_assy_l3, agv_b1_assy_l4]
-    
-    # Assembly -> Buffer2 AGV (각 라인당 1대씩, 총 4대)
-    agv_assy_b2_l1 = Transport(env, 'AGV_ASSY_B2_L1', '조립→Buffer2-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_assy_b2_l2 = Transport(env, 'AGV_ASSY_B2_L2', '조립→Buffer2-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_assy_b2_l3 = Transport(env, 'AGV_ASSY_B2_L3', '조립→Buffer2-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_assy_b2_l4 = Transport(env, 'AGV_ASSY_B2_L4', '조립→Buffer2-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_assy_b2 = [agv_assy_b2_l1, agv_assy_b2_l2, agv_assy_b2_l3, agv_assy_b2_l4]
-    
-    # Buffer2 -> Filling AGV (각 라인당 1대씩, 총 4대)
-    agv_b2_fill_l1 = Transport(env, 'AGV_B2_FILL_L1', 'Buffer2→충진-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b2_fill_l2 = Transport(env, 'AGV_B2_FILL_L2', 'Buffer2→충진-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b2_fill_l3 = Transport(env, 'AGV_B2_FILL_L3', 'Buffer2→충진-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b2_fill_l4 = Transport(env, 'AGV_B2_FILL_L4', 'Buffer2→충진-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_b2_fill = [agv_b2_fill_l1, agv_b2_fill_l2, agv_b2_fill_l3, agv_b2_fill_l4]
-    
-    # Filling -> Buffer3 AGV (각 라인당 1대씩, 총 4대)
-    agv_fill_b3_l1 = Transport(env, 'AGV_FILL_B3_L1', '충진→Buffer3-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_fill_b3_l2 = Transport(env, 'AGV_FILL_B3_L2', '충진→Buffer3-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_fill_b3_l3 = Transport(env, 'AGV_FILL_B3_L3', '충진→Buffer3-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_fill_b3_l4 = Transport(env, 'AGV_FILL_B3_L4', '충진→Buffer3-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_fill_b3 = [agv_fill_b3_l1, agv_fill_b3_l2, agv_fill_b3_l3, agv_fill_b3_l4]
-    
-    # Buffer3 -> Unit3 AGV (각 라인당 1대씩, 총 4대)
-    agv_b3_u3_l1 = Transport(env, 'AGV_B3_U3_L1', 'Buffer3→Unit3-라인1-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b3_u3_l2 = Transport(env, 'AGV_B3_U3_L2', 'Buffer3→Unit3-라인2-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b3_u3_l3 = Transport(env, 'AGV_B3_U3_L3', 'Buffer3→Unit3-라인3-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agv_b3_u3_l4 = Transport(env, 'AGV_B3_U3_L4', 'Buffer3→Unit3-라인4-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
-    agvs_b3_u3 = [agv_b3_u3_l1, agv_b3_u3_l2, agv_b3_u3_l3, agv_b3_u3_l4]
+    # 공정 구간별 AGV (구간마다 라인당 1대씩, 총 4대) - 구간 키로 묶어 한 번에 생성
+    agvs = {
+        key: [Transport(env, f'AGV_{key.upper()}_L{i}', f'{label}-라인{i}-AGV', capacity=3, transport_speed=2.0, transport_type="agv")
+              for i in range(1, 5)]
+        for key, label in _AGV_STAGES
+    }
     
     # AGV는 무인운반차이므로 별도의 운송작업자가 필요하지 않음
     
     # 공정간 운송수단들 (자동화된 컨베이어 및 AGV, 운송작업자 불필요)
-    unit1_conveyors = []
-    for i in range(4):
-        conv1 = Transport(env, f'CONV_U1_L{i}_1', f'Unit1-라인{i}-컨베이어1', capacity=10, transport_speed=1.5, transport_type="conveyor")
-        conv2 = Transport(env, f'CONV_U1_L{i}_2', f'Unit1-라인{i}-컨베이어2', capacity=10, transport_speed=1.5, transport_type="conveyor")
-        unit1_conveyors.extend([conv1, conv2])
+    unit1_conveyors = [Transport(env, conv_id, conv_name, capacity=10, transport_speed=1.5, transport_type="conveyor")
+                       for conv_id, conv_name in zip(_U1_CONV_IDS, _U1_CONV_NAMES)]
     
     # Unit3 공정간 컨베이어 (각 라인당 5개씩, 총 20개) - 자동화
-    unit3_conveyors = []
-    for i in range(4):
-        for j in range(5):
-            conv = Transport(env, f'CONV_U3_L{i}_{j+1}', f'Unit3-라인{i}-컨베이어{j+1}', capacity=8, transport_speed=1.2, transport_type="conveyor")
-            unit3_conveyors.append(conv)
+    unit3_conveyors = [Transport(env, conv_id, conv_name, capacity=8, transport_speed=1.2, transport_type="conveyor")
+                       for conv_id, conv_name in zip(_U3_CONV_IDS, _U3_CONV_NAMES)]
     
     # Buffer 정의 - Unit1->Unit2 버퍼 (각 라인당 하나씩, 총 4개)
     buffer1_line1 = Buffer(env, 'BUFFER1_L1', 'Unit1->Unit2 Buffer Line1', 'intermediate', capacity=25)
@@ -185,163 +244,157 @@ def create_refrigerator_scenario():
     # === MaterialSupplyManager 기반 자재 보충 시스템 ===
     material_supply_manager = MaterialSupplyManager(env)
     
-    # Resource 객체에 자재 보충 설정 추가
-    material_supply_manager.configure_material_resource(side_panel_sheet, {
-        'default_quantity': 30,
-        'min_threshold': 10,
-        'warning_threshold': 20,
-        'supply_time': 2.0
-    })
-    material_supply_manager.configure_material_resource(back_sheet, {
-        'default_quantity': 30,
-        'min_threshold': 10,
-        'warning_threshold': 20,
-        'supply_time': 2.0
-    })
-    material_supply_manager.configure_material_resource(top_cover_sheet, {
-        'default_quantity': 30,
-        'min_threshold': 10,
-        'warning_threshold': 20,
-        'supply_time': 2.0
-    })
-    material_supply_manager.configure_material_resource(top_support_sheet, {
-        'default_quantity': 30,
-        'min_threshold': 10,
-        'warning_threshold': 20,
-        'supply_time': 2.0
-    })
-    
-    # 자재 등록
-    for resource in [side_panel_sheet, back_sheet, top_cover_sheet, top_support_sheet]:
-        material_supply_manager.register_material(resource)
+    # Resource 객체에 자재 보충 설정 추가 및 자재 등록 (공통 설정으로 일괄 처리)
+    material_supply_manager.configure_materials_bulk(
+        [side_panel_sheet, back_sheet, top_cover_sheet, top_support_sheet], MATERIAL_CFG)
     
     # 버퍼 보충 운송 프로세스들 정의
-    replenish_transport_side = TransportProcess(env, 'T_REPLENISH_SIDE', '창고→사이드팰릿보충운송', 
-                                              [agv_warehouse_side], [], 
-                                              {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-    replenish_transport_back = TransportProcess(env, 'T_REPLENISH_BACK', '창고→백시트팰릿보충운송', 
-                                              [agv_warehouse_back], [], 
-                                              {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-    replenish_transport_top = TransportProcess(env, 'T_REPLENISH_TOP', '창고→탑커버팰릿보충운송', 
-                                             [agv_warehouse_top], [], 
-                                             {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-    replenish_transport_lower = TransportProcess(env, 'T_REPLENISH_LOWER', '창고→로워커버팰릿보충운송', 
-                                               [agv_warehouse_lower], [], 
-                                               {}, {}, [], 1.0, 3.0, 1.0, 0.5)
+    replenish_transport_side = _TP(env, 'T_REPLENISH_SIDE', '창고→사이드팰릿보충운송', 
+                                              [agv_warehouse_pool], [], 
+                                              _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+    replenish_transport_back = _TP(env, 'T_REPLENISH_BACK', '창고→백시트팰릿보충운송', 
+                                              [agv_warehouse_pool], [], 
+                                              _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+    replenish_transport_top = _TP(env, 'T_REPLENISH_TOP', '창고→탑커버팰릿보충운송', 
+                                             [agv_warehouse_pool], [], 
+                                             _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+    replenish_transport_lower = _TP(env, 'T_REPLENISH_LOWER', '창고→로워커버팰릿보충운송', 
+                                               [agv_warehouse_pool], [], 
+                                               _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+    
+    # 공정 입출력 자원 레시피 - 공정은 읽기만 하므로 라인 간에 같은 읽기 전용 객체를 공유
+    door_shell_name = door_shell.name
+    final_name = final_refrigerator.name
+    door_assy_in = MappingProxyType({side_panel.name:1, back_panel.name:1, top_cover.name:1, top_support.name:1})
+    door_shell_io = MappingProxyType({door_shell_name:1})
+    main_assy_in = MappingProxyType({door_shell_name:1, main_body.name:1})
+    hinge_in = MappingProxyType({final_name:1, hinge.name:1})
+    func_in = MappingProxyType({final_name:1, functional_part.name:1})
+    final_io = MappingProxyType({final_name:1})
+    # 본체조립~최종마감 병합 공정의 입력 (각 공정 입력 중 외부 부품만 모음)
+    final_fused_in = MappingProxyType({door_shell_name:1, main_body.name:1, hinge.name:1, functional_part.name:1})
     
     # Unit 1: Pressing Processes (4 parallel lines with conveyor connections)
-    press_lines = []
-    part_info = [
-        ("SidePanel", side_panel_sheet, side_panel), ("BackSheet", back_sheet, back_panel),
-        ("TopCover", top_cover_sheet, top_cover), ("TopSupport", top_support_sheet, top_support)
-    ]
-    buffer_info = [side_panel_pallet_buffer, back_sheet_pallet_buffer, top_cover_pallet_buffer, lower_cover_pallet_buffer]
+    press_lines = [None] * 4
+    parts_by_id = {p.resource_id: p for p in (side_panel_sheet, back_sheet, top_cover_sheet, top_support_sheet,
+                                              side_panel, back_panel, top_cover, top_support)}
     
     for i in range(4):
-        p_name, p_in, p_out = part_info[i]
+        p_name, p_in_id, p_out_id = _PART_INFO[i]
+        p_in_io, p_out_io = {parts_by_id[p_in_id].name:1}, {parts_by_id[p_out_id].name:1}
+        press = press_machines[i]
         
         # 팰릿버퍼에서 Unit1 공정으로의 운송 프로세스 생성 (자동화된 컨베이어)
-        transport_pallet_to_blank = TransportProcess(env, f'T_PALLET_BLANK_{i}', f'{p_name}-팰릿→Blanking운송', 
+        transport_pallet_to_blank = _TP(env, f'T_PALLET_BLANK_{i}', f'{p_name}-팰릿→Blanking운송', 
                                                    [pallet_to_unit1_conveyors[i]], [], 
-                                                   {}, {}, [], 0, 1.5, 0, 0)
+                                                   _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_PALLET)
         
         # 공정들 생성 - blanking은 팰릿버퍼에서 운송으로 자재를 받음 (완전 자동화)
-        blanking = ManufacturingProcess(env, f'P_BLANK_{i}', f'{p_name}-Blanking', [press_machines[i]], [], 
-                                      {p_in.name:1}, {p_out.name:1}, [], 10, resource_manager=resource_manager)
-        drawing = ManufacturingProcess(env, f'P_DRAW_{i}', f'{p_name}-Drawing', [press_machines[i]], [], 
-                                     {p_out.name:1}, {p_out.name:1}, [], 15, resource_manager=resource_manager)
-        piercing = ManufacturingProcess(env, f'P_PIERCE_{i}', f'{p_name}-Piercing', [press_machines[i]], [], 
-                                      {p_out.name:1}, {p_out.name:1}, [], 5, resource_manager=resource_manager)
+        blanking = _MP(env, f'P_BLANK_{i}', f'{p_name}-Blanking', [press], [], 
+                                      p_in_io, p_out_io, [], 10, resource_manager=_rm)
+        drawing = _MP(env, f'P_DRAW_{i}', f'{p_name}-Drawing', [press], [], 
+                                     p_out_io, p_out_io, [], 15, resource_manager=_rm)
+        piercing = _MP(env, f'P_PIERCE_{i}', f'{p_name}-Piercing', [press], [], 
+                                      p_out_io, p_out_io, [], 5, resource_manager=_rm)
         
         # Unit1 공정간 운송 프로세스들 생성 (자동화된 컨베이어)
-        transport_blank_draw = TransportProcess(env, f'T_U1_L{i}_BD', f'Unit1-라인{i}-Blanking→Drawing운송', 
+        transport_blank_draw = _TP(env, _U1_IDS[i][0], _U1_NAMES[i][0], 
                                               [unit1_conveyors[i*2]], [], 
-                                              {}, {}, [], 0, 2.0, 0, 0)
-        transport_draw_pierce = TransportProcess(env, f'T_U1_L{i}_DP', f'Unit1-라인{i}-Drawing→Piercing운송', 
+                                              _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U1)
+        transport_draw_pierce = _TP(env, _U1_IDS[i][1], _U1_NAMES[i][1], 
                                                [unit1_conveyors[i*2+1]], [], 
-                                               {}, {}, [], 0, 2.0, 0, 0)
+                                               _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U1)
         
         # 팰릿버퍼에서 시작하여 컨베이어로 연결된 공정 체인 생성
-        press_lines.append(transport_pallet_to_blank >> blanking >> transport_blank_draw >> drawing >> transport_draw_pierce >> piercing)
+        press_lines[i] = ProcessChain.from_list([transport_pallet_to_blank, blanking, transport_blank_draw, drawing,
+                                                 transport_draw_pierce, piercing])
 
+    # 구간별 AGV 운송 프로세스 (라인 순서) - 체인 구성 후 ResourceManager 등록에 재사용
+    agv_procs = {key: [None] * 4 for key, _ in _AGV_STAGES}
+    
     # Unit 2: Door Shell Assembly and Filling (4 parallel lines with AGV connections)
-    unit2_lines = []
+    unit2_lines = [None] * 4
+    # Unit2 AGV 운송 구간 (Unit1→Buffer1 ~ 충진→Buffer3, Buffer3→Unit3은 Unit3에서 생성)
+    unit2_stages = _AGV_STAGES[:5]
     for i in range(4):
-        # Unit1 -> Buffer1 운송 프로세스
-        transport_u1_b1 = TransportProcess(env, f'T_U1_B1_L{i}', f'Unit1→Buffer1-라인{i}-운송', 
-                                          [agvs_u1_b1[i]], [], 
-                                          {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        
-        # Buffer1 -> Assembly 운송 프로세스  
-        transport_b1_assy = TransportProcess(env, f'T_B1_ASSY_L{i}', f'Buffer1→조립-라인{i}-운송', 
-                                           [agvs_b1_assy[i]], [], 
-                                           {}, {}, [], 1.0, 3.0, 1.0, 0.5)
+        # 구간별 AGV 운송 프로세스 일괄 생성
+        tps = {key: _TP(env, _AGV_IDS[key][i], _AGV_NAMES[key][i], [agvs[key][i]], [],
+                        _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+               for key, _ in unit2_stages}
+        for key, _ in unit2_stages:
+            agv_procs[key][i] = tps[key]
         
         # 공정들 생성 (완전 자동화)
-        door_assembly = AssemblyProcess(env, f'P_DOOR_ASSY_{i}', f'도어쉘조립{i}', [assembly_robots[i]], [], 
-                                      {side_panel.name:1, back_panel.name:1, top_cover.name:1, top_support.name:1}, 
-                                      {door_shell.name:1}, [], 25, resource_manager=resource_manager)
-        
-        # Assembly -> Buffer2 운송 프로세스
-        transport_assy_b2 = TransportProcess(env, f'T_ASSY_B2_L{i}', f'조립→Buffer2-라인{i}-운송', 
-                                           [agvs_assy_b2[i]], [], 
-                                           {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        
-        # Buffer2 -> Filling 운송 프로세스
-        transport_b2_fill = TransportProcess(env, f'T_B2_FILL_L{i}', f'Buffer2→충진-라인{i}-운송', 
-                                           [agvs_b2_fill[i]], [], 
-                                           {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        
-        foam_filling = ManufacturingProcess(env, f'P_FOAM_{i}', f'발포충진{i}', [filling_machines[i]], [], 
-                                          {door_shell.name:1}, {door_shell.name:1}, [], 50, resource_manager=resource_manager)
-        
-        # Filling -> Buffer3 운송 프로세스
-        transport_fill_b3 = TransportProcess(env, f'T_FILL_B3_L{i}', f'충진→Buffer3-라인{i}-운송', 
-                                           [agvs_fill_b3[i]], [], 
-                                           {}, {}, [], 1.0, 3.0, 1.0, 0.5)
+        door_assembly = _AP(env, f'P_DOOR_ASSY_{i}', f'도어쉘조립{i}', [assembly_robots[i]], [], 
+                                      door_assy_in, door_shell_io, [], 25, resource_manager=_rm)
+        foam_filling = _MP(env, f'P_FOAM_{i}', f'발포충진{i}', [filling_machines[i]], [], 
+                                          door_shell_io, door_shell_io, [], 50, resource_manager=_rm)
         
         # AGV로 연결된 전체 Unit2 공정 체인 생성
-        unit2_lines.append(transport_u1_b1 >> transport_b1_assy >> door_assembly >> transport_assy_b2 >> 
-                          transport_b2_fill >> foam_filling >> transport_fill_b3)
+        unit2_lines[i] = ProcessChain.from_list([tps['u1_b1'], tps['b1_assy'], door_assembly, tps['assy_b2'],
+                                                 tps['b2_fill'], foam_filling, tps['fill_b3']])
 
     # Unit 3: Final Assembly Lines (4 parallel lines with conveyor connections and AGV input)
-    final_lines = []
+    final_lines = [None] * 4
     for i in range(4):
         # Buffer3 -> Unit3 운송 프로세스
-        transport_b3_u3 = TransportProcess(env, f'T_B3_U3_L{i}', f'Buffer3→Unit3-라인{i}-운송', 
-                                         [agvs_b3_u3[i]], [], 
-                                         {}, {}, [], 1.0, 3.0, 1.0, 0.5)
+        transport_b3_u3 = _TP(env, _AGV_IDS['b3_u3'][i], _AGV_NAMES['b3_u3'][i], 
+                                         [agvs['b3_u3'][i]], [], 
+                                         _EMPTY, _EMPTY, _EMPTY_LIST, *AGV_T)
+        
+        agv_procs['b3_u3'][i] = transport_b3_u3
+        
+        # 라인 i에서 반복 사용하는 로봇/컨베이어를 지역 변수로 한 번만 조회
+        robot = final_assembly_robots[i]
+        conv_base = i * 5
+        
+        if FUSE_U3_SERIAL:
+            # 같은 로봇(용량 1)에서 어차피 직렬로 처리되는 5개 공정을 하나로 병합
+            # 사이 컨베이어 운송 프로세스는 만들지 않고 그 사이클 시간만 처리 시간에 더함
+            # 품질검사는 별도 설비(품질검사기)를 쓰므로 병합하지 않음
+            final_assy = _AP(env, f'P_FINAL_ASSY_{i}', f'최종조립{i}', [robot], [], 
+                             final_fused_in, final_io, [], _U3_FUSED_TIME, resource_manager=None)
+            inspection = _QC(env, f'P_INSPECT_{i}', f'품질검사{i}', [inspection_machines[i]], [], 
+                             final_io, final_io, [], 20)
+            transport_finish_inspect = _TP(env, _U3_IDS[i][4], _U3_NAMES[i][4], 
+                                           [unit3_conveyors[conv_base + 4]], [], 
+                                           _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
+            for proc in (final_assy, inspection):
+                proc.enable_output_blocking_feature(False)
+            final_lines[i] = ProcessChain.from_list([transport_b3_u3, final_assy, transport_finish_inspect,
+                                                     inspection])
+            continue
         
         # 공정들 생성 (완전 자동화)
-        main_assy = AssemblyProcess(env, f'P_MAIN_ASSY_{i}', f'본체조립{i}', [final_assembly_robots[i]], [], 
-                                  {door_shell.name:1, main_body.name:1}, {final_refrigerator.name:1}, [], 20, resource_manager=None)
-        hinge_inst = ManufacturingProcess(env, f'P_HINGE_{i}', f'힌지결합{i}', [final_assembly_robots[i]], [], 
-                                        {final_refrigerator.name:1, hinge.name:1}, {final_refrigerator.name:1}, [], 15, resource_manager=None)
-        door_inst = ManufacturingProcess(env, f'P_DOOR_INST_{i}', f'도어결합{i}', [final_assembly_robots[i]], [], 
-                                       {final_refrigerator.name:1}, {final_refrigerator.name:1}, [], 15, resource_manager=None)
-        func_inst = ManufacturingProcess(env, f'P_FUNC_{i}', f'기능부품결합{i}', [final_assembly_robots[i]], [], 
-                                       {final_refrigerator.name:1, functional_part.name:1}, {final_refrigerator.name:1}, [], 20, resource_manager=None)
-        finishing = ManufacturingProcess(env, f'P_FINISH_{i}', f'최종마감{i}', [final_assembly_robots[i]], [], 
-                                       {final_refrigerator.name:1}, {final_refrigerator.name:1}, [], 10, resource_manager=None)
-        inspection = QualityControlProcess(env, f'P_INSPECT_{i}', f'품질검사{i}', [inspection_machines[i]], [], 
-                                         {final_refrigerator.name:1}, {final_refrigerator.name:1}, [], 20)
+        main_assy = _AP(env, f'P_MAIN_ASSY_{i}', f'본체조립{i}', [robot], [], 
+                                  main_assy_in, final_io, [], 20, resource_manager=None)
+        hinge_inst = _MP(env, f'P_HINGE_{i}', f'힌지결합{i}', [robot], [], 
+                                        hinge_in, final_io, [], 15, resource_manager=None)
+        door_inst = _MP(env, f'P_DOOR_INST_{i}', f'도어결합{i}', [robot], [], 
+                                       final_io, final_io, [], 15, resource_manager=None)
+        func_inst = _MP(env, f'P_FUNC_{i}', f'기능부품결합{i}', [robot], [], 
+                                       func_in, final_io, [], 20, resource_manager=None)
+        finishing = _MP(env, f'P_FINISH_{i}', f'최종마감{i}', [robot], [], 
+                                       final_io, final_io, [], 10, resource_manager=None)
+        inspection = _QC(env, f'P_INSPECT_{i}', f'품질검사{i}', [inspection_machines[i]], [], 
+                                         final_io, final_io, [], 20)
         
         # Unit3 공정간 운송 프로세스들 생성 (자동화된 컨베이어)
-        transport_main_hinge = TransportProcess(env, f'T_U3_L{i}_MH', f'Unit3-라인{i}-본체조립→힌지결합운송', 
-                                              [unit3_conveyors[i*5]], [], 
-                                              {}, {}, [], 0, 1.5, 0, 0)
-        transport_hinge_door = TransportProcess(env, f'T_U3_L{i}_HD', f'Unit3-라인{i}-힌지결합→도어결합운송', 
-                                              [unit3_conveyors[i*5+1]], [], 
-                                              {}, {}, [], 0, 1.5, 0, 0)
-        transport_door_func = TransportProcess(env, f'T_U3_L{i}_DF', f'Unit3-라인{i}-도어결합→기능부품결합운송', 
-                                             [unit3_conveyors[i*5+2]], [], 
-                                             {}, {}, [], 0, 1.5, 0, 0)
-        transport_func_finish = TransportProcess(env, f'T_U3_L{i}_FF', f'Unit3-라인{i}-기능부품결합→최종마감운송', 
-                                               [unit3_conveyors[i*5+3]], [], 
-                                               {}, {}, [], 0, 1.5, 0, 0)
-        transport_finish_inspect = TransportProcess(env, f'T_U3_L{i}_FI', f'Unit3-라인{i}-최종마감→품질검사운송', 
-                                                  [unit3_conveyors[i*5+4]], [], 
-                                                  {}, {}, [], 0, 1.5, 0, 0)
+        transport_main_hinge = _TP(env, _U3_IDS[i][0], _U3_NAMES[i][0], 
+                                              [unit3_conveyors[conv_base]], [], 
+                                              _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
+        transport_hinge_door = _TP(env, _U3_IDS[i][1], _U3_NAMES[i][1], 
+                                              [unit3_conveyors[conv_base + 1]], [], 
+                                              _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
+        transport_door_func = _TP(env, _U3_IDS[i][2], _U3_NAMES[i][2], 
+                                             [unit3_conveyors[conv_base + 2]], [], 
+                                             _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
+        transport_func_finish = _TP(env, _U3_IDS[i][3], _U3_NAMES[i][3], 
+                                               [unit3_conveyors[conv_base + 3]], [], 
+                                               _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
+        transport_finish_inspect = _TP(env, _U3_IDS[i][4], _U3_NAMES[i][4], 
+                                                  [unit3_conveyors[conv_base + 4]], [], 
+                                                  _EMPTY, _EMPTY, _EMPTY_LIST, *CONV_T_U3)
         
         # 교착 상태(Deadlock) 방지를 위해 연속 공정의 출력 버퍼 블로킹 기능 비활성화
         process_chain_for_blocking_disable = [main_assy, hinge_inst, door_inst, func_inst, finishing, inspection]
@@ -349,78 +402,53 @@ def create_refrigerator_scenario():
             proc.enable_output_blocking_feature(False)
 
         # AGV + 컨베이어로 연결된 공정 체인 생성
-        final_lines.append(transport_b3_u3 >> main_assy >> transport_main_hinge >> hinge_inst >> transport_hinge_door >> 
-                          door_inst >> transport_door_func >> func_inst >> transport_func_finish >> 
-                          finishing >> transport_finish_inspect >> inspection)
+        final_lines[i] = ProcessChain.from_list([transport_b3_u3, main_assy, transport_main_hinge, hinge_inst,
+                                                 transport_hinge_door, door_inst, transport_door_func, func_inst,
+                                                 transport_func_finish, finishing, transport_finish_inspect,
+                                                 inspection])
         
-    # AGV 운송 프로세스들을 ResourceManager에 등록
-    agv_transport_processes = []
+    # AGV 운송 프로세스들을 ResourceManager에 등록 (라인 체인에 사용된 인스턴스를 그대로 등록)
+    agv_transport_processes = [None] * (4 * len(_AGV_STAGES))
+    reg = {}
+    idx = 0
     for i in range(4):
-        # Unit1->Buffer1 AGV 운송 프로세스들
-        transport_u1_b1 = TransportProcess(env, f'T_U1_B1_L{i}_RM', f'Unit1→Buffer1-라인{i}-RM운송', 
-                                          [agvs_u1_b1[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_u1_b1)
-        resource_manager.register_transport_process(f"transport_u1_b1_l{i}", transport_u1_b1)
-        
-        # Buffer1->Assembly AGV 운송 프로세스들
-        transport_b1_assy = TransportProcess(env, f'T_B1_ASSY_L{i}_RM', f'Buffer1→조립-라인{i}-RM운송', 
-                                           [agvs_b1_assy[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_b1_assy)
-        resource_manager.register_transport_process(f"transport_b1_assy_l{i}", transport_b1_assy)
-        
-        # Assembly->Buffer2 AGV 운송 프로세스들
-        transport_assy_b2 = TransportProcess(env, f'T_ASSY_B2_L{i}_RM', f'조립→Buffer2-라인{i}-RM운송', 
-                                           [agvs_assy_b2[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_assy_b2)
-        resource_manager.register_transport_process(f"transport_assy_b2_l{i}", transport_assy_b2)
-        
-        # Buffer2->Filling AGV 운송 프로세스들
-        transport_b2_fill = TransportProcess(env, f'T_B2_FILL_L{i}_RM', f'Buffer2→충진-라인{i}-RM운송', 
-                                           [agvs_b2_fill[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_b2_fill)
-        resource_manager.register_transport_process(f"transport_b2_fill_l{i}", transport_b2_fill)
-        
-        # Filling->Buffer3 AGV 운송 프로세스들
-        transport_fill_b3 = TransportProcess(env, f'T_FILL_B3_L{i}_RM', f'충진→Buffer3-라인{i}-RM운송', 
-                                           [agvs_fill_b3[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_fill_b3)
-        resource_manager.register_transport_process(f"transport_fill_b3_l{i}", transport_fill_b3)
-        
-        # Buffer3->Unit3 AGV 운송 프로세스들
-        transport_b3_u3 = TransportProcess(env, f'T_B3_U3_L{i}_RM', f'Buffer3→Unit3-라인{i}-RM운송', 
-                                         [agvs_b3_u3[i]], [], {}, {}, [], 1.0, 3.0, 1.0, 0.5)
-        agv_transport_processes.append(transport_b3_u3)
-        resource_manager.register_transport_process(f"transport_b3_u3_l{i}", transport_b3_u3)
-    
-    
-    # Unit내 공정간 운송 프로세스들도 등록 (필요시)
-    print(f"운송 시스템 구성 완료:")
-    print(f"   - Unit1 컨베이어: {len(unit1_conveyors)}대 (자동화)")
-    print(f"   - Unit1→Buffer1 AGV: {len(agvs_u1_b1)}대") 
-    print(f"   - Buffer1→조립 AGV: {len(agvs_b1_assy)}대")
-    print(f"   - 조립→Buffer2 AGV: {len(agvs_assy_b2)}대")
-    print(f"   - Buffer2→충진 AGV: {len(agvs_b2_fill)}대")
-    print(f"   - 충진→Buffer3 AGV: {len(agvs_fill_b3)}대")
-    print(f"   - Buffer3→Unit3 AGV: {len(agvs_b3_u3)}대")
-    print(f"   - Unit3 컨베이어: {len(unit3_conveyors)}대 (자동화)")
-    print(f"   - 총 AGV 수: {len(agv_transport_processes)}대")
-    print(f"   - 자재창고→팰릿버퍼 보충 AGV: {len(warehouse_agvs)}대")
-    print(f"   - 팰릿버퍼→Unit1 컨베이어: {len(pallet_to_unit1_conveyors)}대 (자동화)")
-    print(f"   - 완전 자동화 공정: 모든 제조 및 운송 작업이 기계에 의해 수행됨")
+        for key, _ in _AGV_STAGES:
+            transport = agv_procs[key][i]
+            agv_transport_processes[idx] = transport
+            idx += 1
+            reg[f"transport_{key}_l{i}"] = transport
+    _rm.register_transport_processes_bulk(reg)
+    
+    # 운송 시스템 구성 요약 (한 번에 출력, verbose=False면 생략)
+    if verbose:
+        summary = [
+            "운송 시스템 구성 완료:",
+            f"   - Unit1 컨베이어: {len(unit1_conveyors)}대 (자동화)",
+            *(f"   - {label} AGV: {len(agvs[key])}대" for key, label in _AGV_STAGES),
+            f"   - Unit3 컨베이어: {len(unit3_conveyors)}대 (자동화)",
+            f"   - 총 AGV 수: {len(agv_transport_processes)}대",
+            f"   - 자재창고→팰릿버퍼 보충 AGV: {agv_warehouse_pool.capacity}대 (공용 풀)",
+            f"   - 팰릿버퍼→Unit1 컨베이어: {len(pallet_to_unit1_conveyors)}대 (자동화)",
+            "   - 완전 자동화 공정: 모든 제조 및 운송 작업이 기계에 의해 수행됨",
+        ]
+        print("\n".join(summary))
     
     # === MaterialSupplyManager 기반 자재 보충 시스템 설정 ===
     
     # 공급 경로 등록 (Resource 객체 직접 사용)
     supply_routes = [
-        SupplyRoute('route_side', side_panel_pallet_buffer, replenish_transport_side, side_panel_sheet),
-        SupplyRoute('route_back', back_sheet_pallet_buffer, replenish_transport_back, back_sheet),
-        SupplyRoute('route_top', top_cover_pallet_buffer, replenish_transport_top, top_cover_sheet),
-        SupplyRoute('route_lower', lower_cover_pallet_buffer, replenish_transport_lower, top_support_sheet)
+        SupplyRoute('route_side', side_panel_pallet_buffer, replenish_transport_side, side_panel_sheet, route_tag='side'),
+        SupplyRoute('route_back', back_sheet_pallet_buffer, replenish_transport_back, back_sheet, route_tag='back'),
+        SupplyRoute('route_top', top_cover_pallet_buffer, replenish_transport_top, top_cover_sheet, route_tag='top'),
+        SupplyRoute('route_lower', lower_cover_pallet_buffer, replenish_transport_lower, top_support_sheet,
+                    route_tag='lower')
     ]
     
     for route in supply_routes:
         material_supply_manager.register_supply_route(route.source_id, route)
     
+    material_supply_manager.finalize_routes()
+    
     # 자동 모니터링 시작 (임계값 기반)
     material_supply_manager.start_supply_monitoring(SupplyStrategy.THRESHOLD_BASED)
     
@@ -428,12 +456,9 @@ def create_refrigerator_scenario():
     material_supply_manager.setup_initial_inventory()
     
     # --- 5. 워크플로우(Workflow) 구성 ---
-    unit1_workflow = MultiProcessGroup(press_lines)
-    unit2_workflow = MultiProcessGroup(unit2_lines)
-    unit3_workflow = MultiProcessGroup(final_lines)
-
-    # Unit1, Unit2, Unit3을 동시에 작동하도록 병렬 워크플로우 구성
-    complete_workflow = MultiProcessGroup([unit1_workflow, unit2_workflow, unit3_workflow])
+    # Unit1, Unit2, Unit3의 모든 라인을 한 단계 병렬 그룹으로 구성
+    # (유닛별 중첩 그룹을 두지 않아 SimPy 프로세스/제너레이터 계층이 한 단계 줄어듦)
+    complete_workflow = MultiProcessGroup([*press_lines, *unit2_lines, *final_lines])
     
     # --- 6. 자동 생산 시작 설정 ---
     # 단순히 워크플로우를 프로세스에 등록 (제품 1개로 시작)
@@ -454,6 +479,8 @@ def create_refrigerator_scenario():
 @log_execution("냉장고_제조공정_시뮬레이션")
 def main():
     """메인 실행 함수 - 간단한 로깅 적용"""
+    import simpy
+    
     print("### 냉장고 제조공정 시뮬레이션 초기화 ###")
     scenario_data = create_refrigerator_scenario()
     env = scenario_data['env']
@@ -461,11 +488,16 @@ def main():
     workflow = scenario_data['workflow']
     pallet_buffers = scenario_data['pallet_buffers']
 
+    # 배치 시뮬레이션은 실시간(벽시계) 동기화 없이 실행되어야 함
+    assert not isinstance(env, simpy.RealtimeEnvironment), \
+        "배치 시뮬레이션에는 RealtimeEnvironment 대신 simpy.Environment를 사용하세요."
+
     print("\n### 시뮬레이션 자동 실행 ###")
     print("시뮬레이션이 자동으로 시작됩니다...")
     
     # 자동 생산이 설정되어 있으므로 바로 시뮬레이션 실행
-    engine.run(until=1000)
+    # (LogContext는 fd 1을 임시 파일로 돌려 캡처하므로, 줄 단위 flush 없이 모아서 기록)
+    engine.run(until=1000, buffered_output=True)
     
     print("\n### 시뮬레이션 완료 ###")
     print("모든 로그가 자동으로 MD 파일로 저장되었습니다.")
@@ -9,6 +9,7 @@ from typing import List, Optional, Any, Union, Generator
 import uuid
 import simpy
 from src.Processes.base_process import BaseProcess
+from src.utils.log_util import record_chain_event
 
 
 
@@ -31,6 +32,32 @@ class ProcessChain:
         self.env = self._extract_environment()
         self.parallel_safe = True
     
+    @classmethod
+    def from_list(cls, processes: List['BaseProcess']) -> 'ProcessChain':
+        """
+        공정 리스트로 체인을 한 번에 생성
+        
+        `a >> b >> c`처럼 연산자를 반복하면 단계마다 중간 체인이 새로 만들어지므로,
+        공정 순서가 미리 정해진 경우 이 메서드로 한 번에 구성합니다.
+        
+        Args:
+            processes: 실행 순서대로 나열된 공정 리스트
+            
+        Returns:
+            ProcessChain: 생성된 공정 체인
+            
+        Raises:
+            ValueError: 공정 중 None이 포함된 경우
+            TypeError: BaseProcess가 아닌 객체가 포함된 경우
+        """
+        processes = list(processes)
+        for process in processes:
+            if process is None:
+                raise ValueError("추가할 공정이 None입니다.")
+            if not isinstance(process, BaseProcess):
+                raise TypeError(f"BaseProcess 타입이어야 합니다. 받은 타입: {type(process)}")
+        return cls(processes)
+    
     def _extract_environment(self) -> Optional[simpy.Environment]:
         """
         체인 내 공정들로부터 SimPy 환경을 추출
@@ -116,13 +143,15 @@ class ProcessChain:
         print(f"[시간 {self.env.now:.1f}] 공정 체인 실행 시작 (체인 ID: {self.chain_id})")
         print(f"총 {len(self.processes)}개의 공정을 순차 실행합니다.")
         
+        # 단계별 진행 이벤트: LogContext 캡처 중에는 모아 두었다가 종료 시 한 번에 렌더링, 아니면 바로 출력
+        total = len(self.processes)
         for i, process in enumerate(self.processes, 1):
-            print(f"\n[시간 {self.env.now:.1f}] [{i}/{len(self.processes)}] {process.process_name} 실행 중...")
+            record_chain_event(self.env.now, self.chain_id, i, total, process.process_name, "start")
             
             try:
                 if hasattr(process, 'execute') and callable(process.execute):
                     current_data = yield from process.execute(current_data)
-                    print(f"[시간 {self.env.now:.1f}] [{i}/{len(self.processes)}] {process.process_name} 완료")
+                    record_chain_event(self.env.now, self.chain_id, i, total, process.process_name, "done")
                 else:
                     print(f"[경고] {process.process_name}에 execute 메서드가 없습니다. 건너뜀.")
                     continue
@@ -75,7 +75,7 @@ class Machine(Resource):
             if self.failure_probability is not None and self._check_failure():
                 print(f"[시간 {self.env.now:.1f}] {self.resource_id} 기계에 고장이 발생했습니다!")
                 # 고장이 발생하면 수리 프로세스 시작
-                yield self.env.process(self._repair_process())
+                yield from self._repair_process()
                 return  # 고장 발생 시 현재 작업 중단
             
             # 처리 시간만큼 대기
@@ -87,6 +87,31 @@ class Machine(Resource):
             
             print(f"[시간 {self.env.now:.1f}] {self.resource_id} 기계가 제품 {getattr(product, 'resource_id', 'Unknown')} 처리를 완료했습니다.")
     
+    def clone_for(self, env: simpy.Environment, resource_id: Optional[str] = None,
+                  name: Optional[str] = None) -> 'Machine':
+        """같은 설정(용량, 처리 시간, 고장 매개변수)을 가진 새 기계를 생성합니다.
+        
+        통계와 상태는 복사하지 않으므로 반복 실행이나 다른 환경용 설비를 만들 때 사용합니다.
+        
+        Args:
+            env (simpy.Environment): 새 기계가 사용할 SimPy 환경 (필수)
+            resource_id (Optional[str]): 새 기계 ID (None이면 원본 ID 사용)
+            name (Optional[str]): 새 기계 이름 (None이면 원본 이름 사용)
+            
+        Returns:
+            Machine: 설정이 복사된 새 기계 객체
+        """
+        return Machine(
+            env,
+            resource_id if resource_id is not None else self.resource_id,
+            name if name is not None else self.name,
+            capacity=self.capacity,
+            processing_time=self.processing_time,
+            failure_probability=self.failure_probability,
+            mean_time_to_failure=self.mean_time_to_failure,
+            mean_time_to_repair=self.mean_time_to_repair
+        )
+
     def get_utilization(self) -> float:
         """기계의 가동률을 계산합니다.
         
@@ -212,6 +237,6 @@ class Machine(Resource):
             simpy.Event: SimPy 이벤트들
         """
         print(f"[시간 {self.env.now:.1f}] {self.resource_id} 기계에 강제 고장을 발생시킵니다.")
-        yield self.env.process(self._repair_process())
+        yield from self._repair_process()
 
 
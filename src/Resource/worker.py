@@ -86,7 +86,7 @@ class Worker(Resource):
             if self.mean_time_to_rest is not None and self._check_rest_needed():
                 print(f"[시간 {self.env.now:.1f}] 작업자 {self.resource_id}가 휴식이 필요합니다!")
                 # 휴식 프로세스 시작
-                yield self.env.process(self._rest_process())
+                yield from self._rest_process()
                 return  # 휴식 후 작업 재시작 필요
             
             # 작업 시간만큼 대기
@@ -258,7 +258,7 @@ class Worker(Resource):
             simpy.Event: SimPy 이벤트들
         """
         print(f"[시간 {self.env.now:.1f}] 작업자 {self.resource_id}에게 강제 휴식을 발생시킵니다.")
-        yield self.env.process(self._rest_process())
+        yield from self._rest_process()
         
     def learn_skill(self, new_skill: str):
         """작업자가 새로운 기술을 습득합니다.
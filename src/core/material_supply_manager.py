@@ -6,6 +6,7 @@ ReportManager와 통합하여 임계값 기반 자동 보충 시스템을 구현
 """
 
 import simpy
+import numpy as np
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -13,6 +14,10 @@ from enum import Enum
 from src.Resource.product import Product
 from src.core.report_manager import ReportManager
 from src.Processes.transport_process import TransportProcess
+from src.utils.log_util import get_sim_logger
+
+# 보충 이벤트마다 발생하는 로그 (ALBBA_VERBOSE=1일 때만 출력)
+LOG = get_sim_logger(__name__)
 
 
 class SupplyStrategy(Enum):
@@ -29,6 +34,7 @@ class SupplyRoute:
     target_buffer: Any
     transport_process: TransportProcess
     material_resource: Any  # Resource 객체 직접 사용
+    route_tag: Optional[str] = None  # 운송 자원을 여러 경로가 공유할 때 경로 구분용 태그
     
 
 class MaterialSupplyManager:
@@ -60,6 +66,11 @@ class MaterialSupplyManager:
         # 모니터링 프로세스 관리 (resource_manager 패턴 따름)
         self._monitoring_process = None
         
+        # finalize_routes()가 만드는 경로 조회 테이블 (경로 등록 시 무효화)
+        self._route_ids: Optional[List[str]] = None
+        self._route_by_buffer: Dict[str, str] = {}
+        self._warning_thresholds: Optional[np.ndarray] = None
+        
     def register_material(self, material_resource: Any):
         """
         자재를 등록합니다 (Resource 클래스 활용)
@@ -79,6 +90,7 @@ class MaterialSupplyManager:
             supply_route: 공급 경로 설정
         """
         self.supply_routes[route_id] = supply_route
+        self._route_ids = None
         
         # ReportManager에 버퍼 등록 및 임계값 설정 (Resource 클래스 활용)
         buffer = supply_route.target_buffer
@@ -131,7 +143,8 @@ class MaterialSupplyManager:
             for i in range(actual_quantity)
         ]
         
-        print(f"[MaterialSupplyManager] {material_name} {actual_quantity}개 생성 완료 (총 공급: {self.total_supplies[material_name]}개)")
+        LOG.info("[MaterialSupplyManager] %s %d개 생성 완료 (총 공급: %d개)",
+                 material_name, actual_quantity, self.total_supplies[material_name])
         return materials
         
     def auto_replenish(self, route_id: str, quantity: Optional[int] = None):
@@ -159,7 +172,8 @@ class MaterialSupplyManager:
                 yield from route.transport_process.execute(material)
                 yield from route.target_buffer.put(material)
                 
-            print(f"[MaterialSupplyManager] {route.target_buffer.name} 자동 보충 완료")
+            LOG.info("[MaterialSupplyManager] %s 자동 보충 완료 (경로: %s)",
+                     route.target_buffer.name, route.route_tag or route.source_id)
             
         except Exception as e:
             print(f"[MaterialSupplyManager] 자동 보충 실패 ({route_id}): {e}")
@@ -177,17 +191,13 @@ class MaterialSupplyManager:
         buffer_id = alert['component_id']
         
         # 해당 버퍼와 연결된 공급 경로 찾기
-        matching_route = None
-        route_id = None
-        
-        for rid, route in self.supply_routes.items():
-            if route.target_buffer.resource_id == buffer_id:
-                matching_route = route
-                route_id = rid
-                break
+        if self._route_ids is None:
+            self.finalize_routes()
+        route_id = self._route_by_buffer.get(buffer_id)
                 
-        if matching_route:
-            print(f"[MaterialSupplyManager] {matching_route.target_buffer.name} 재고부족 알림 - 자동보충 시작")
+        if route_id is not None:
+            matching_route = self.supply_routes[route_id]
+            LOG.info("[MaterialSupplyManager] %s 재고부족 알림 - 자동보충 시작", matching_route.target_buffer.name)
             self.env.process(self.auto_replenish(route_id))
         else:
             print(f"[MaterialSupplyManager] 경고: 버퍼 {buffer_id}에 대한 공급 경로를 찾을 수 없음")
@@ -241,22 +251,42 @@ class MaterialSupplyManager:
         # ReportManager를 통한 실시간 상태 수집 (기존 프레임워크 활용)
         status_data = self.report_manager.collect_real_time_status()
         
-        # 정해진 시간 간격으로 모든 버퍼 체크 및 보충
-        for route_id, route in self.supply_routes.items():
-            buffer = route.target_buffer
-            material_resource = route.material_resource
-            
+        if self._route_ids is None:
+            self.finalize_routes()
+        route_ids = self._route_ids
+        resources_status = status_data.get('resources', {})
+        
+        # 정해진 시간 간격으로 모든 버퍼 레벨을 모아 경고 임계값과 한 번에 비교
+        levels = np.empty(len(route_ids), dtype=np.float64)
+        for i, route_id in enumerate(route_ids):
+            buffer = self.supply_routes[route_id].target_buffer
             # ReportManager의 실시간 상태에서 버퍼 레벨 확인
-            buffer_status = status_data.get('resources', {}).get(buffer.resource_id, {})
-            current_level = buffer_status.get('current_level', buffer.get_current_level())
-            
-            # Resource의 properties에서 경고 임계값 가져오기
-            warning_threshold = material_resource.get_property('warning_threshold', 20)
-            
-            # 경고 임계값 이하인 경우 보충
-            if current_level <= warning_threshold:
-                yield from self.auto_replenish(route_id)
+            buffer_status = resources_status.get(buffer.resource_id, {})
+            levels[i] = buffer_status.get('current_level', buffer.get_current_level())
+        
+        # 경고 임계값 이하인 경로만 보충
+        for i in np.flatnonzero(levels <= self._warning_thresholds):
+            yield from self.auto_replenish(route_ids[i])
                 
+    def finalize_routes(self):
+        """
+        등록된 공급 경로의 조회 테이블을 만듭니다
+        
+        버퍼 ID → 경로 ID 딕셔너리와 경로 순서대로 정렬된 경고 임계값 배열을 구성합니다.
+        경로를 모두 등록한 뒤 호출하며, 이후 경로가 추가되면 다음 조회 시 자동으로 다시 만듭니다.
+        """
+        route_ids = list(self.supply_routes)
+        self._route_by_buffer = {}
+        for route_id in route_ids:
+            # 같은 버퍼에 경로가 여러 개면 먼저 등록된 경로를 사용
+            self._route_by_buffer.setdefault(self.supply_routes[route_id].target_buffer.resource_id, route_id)
+        # Resource의 properties에서 경고 임계값 가져오기
+        self._warning_thresholds = np.ascontiguousarray(
+            [self.supply_routes[r].material_resource.get_property('warning_threshold', 20) for r in route_ids],
+            dtype=np.float64
+        )
+        self._route_ids = route_ids
+        
     def stop_supply_monitoring(self):
         """자재 보충 모니터링을 중지합니다"""
         if self._monitoring_process:
@@ -309,6 +339,26 @@ class MaterialSupplyManager:
         
         return resource
         
+    def configure_materials_bulk(self, resources: List[Any], config_dict: Dict[str, Any]) -> List[Any]:
+        """
+        여러 Resource 객체에 같은 자재 보충 설정을 적용하고 한 번에 등록합니다
+        
+        configure_material_resource와 register_material을 자재마다 따로 호출하는 것과 같습니다.
+        
+        Args:
+            resources: Resource 객체 리스트
+            config_dict: 모든 자재에 공통으로 적용할 자재 보충 설정 딕셔너리
+            
+        Returns:
+            List[Any]: 설정 및 등록이 끝난 Resource 객체 리스트
+        """
+        configure = self.configure_material_resource
+        total_supplies = self.total_supplies
+        for resource in resources:
+            configure(resource, config_dict)
+            total_supplies[resource.name] = 0
+        return resources
+        
     def setup_initial_inventory(self, material_quantities: Optional[Dict[str, int]] = None):
         """
         초기 재고를 설정합니다 (시뮬레이션 시간 소모 없음)
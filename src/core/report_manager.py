@@ -12,18 +12,45 @@
 - 대시보드 데이터 제공
 """
 
+import os
+import hashlib
 import simpy
 import time
 import json
 import csv
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import warnings
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 
-from src.utils.visualization import VisualizationManager
+try:
+    import orjson  # 선택적 의존성: 설치되어 있으면 JSON 내보내기에 사용
+except ImportError:
+    orjson = None
+
+from src.utils.log_util import get_sim_logger
+
+# 틱마다 발생하는 알림 등 상세 로그 (ALBBA_VERBOSE=1일 때만 출력)
+LOG = get_sim_logger(__name__)
+
+# 시각화 단계 생략 여부 (1이면 matplotlib을 불러오지 않고 차트 생성을 건너뜀)
+SKIP_VIZ = os.environ.get("ALBBA_SKIP_VIZ") == "1"
+
+
+def _dumps_json_line(obj: Any) -> bytes:
+    """객체를 NDJSON 한 줄(UTF-8 바이트, 줄바꿈 포함)로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, ensure_ascii=False, default=str) + '\n').encode('utf-8')
 
 
 class AlertSeverity(Enum):
@@ -104,10 +131,18 @@ class ResourceStateTracker:
             lambda: deque(maxlen=max_history)
         )
         self.resource_registry: Dict[str, Any] = {}
+        # 리소스별 메트릭 수집 함수 목록 [(메트릭 이름, 호출 가능 객체), ...] (등록 시 한 번 결정)
+        self._metric_samplers: Dict[str, List[tuple]] = {}
+        
+        # 사용률 이력 (리소스별 시간(float64)/사용률(float32) NumPy 링 버퍼 + 누적 기록 수)
+        self.utilization_times: Dict[str, np.ndarray] = {}
+        self.utilization_values: Dict[str, np.ndarray] = {}
+        self.utilization_count: Dict[str, int] = defaultdict(int)
         
     def register_resource(self, resource_id: str, resource_obj: Any):
         """리소스 등록"""
         self.resource_registry[resource_id] = resource_obj
+        self._metric_samplers[resource_id] = self._build_metric_samplers(resource_obj)
         print(f"[ReportManager] 리소스 등록: {resource_id}")
         
     def track_resource_state(self, resource_id: str) -> ResourceStateSnapshot:
@@ -119,8 +154,11 @@ class ResourceStateTracker:
         
         # 리소스 타입에 따른 상태 수집
         status = self._collect_resource_status(resource_obj)
-        metrics = self._collect_resource_metrics(resource_obj)
-        alerts = self._collect_resource_alerts(resource_obj)
+        samplers = self._metric_samplers.get(resource_id)
+        if samplers is None:
+            samplers = self._metric_samplers[resource_id] = self._build_metric_samplers(resource_obj)
+        metrics = {name: sample() for name, sample in samplers}
+        alerts = self._collect_resource_alerts(resource_obj, metrics.get('utilization'))
         
         snapshot = ResourceStateSnapshot(
             resource_id=resource_id,
@@ -131,11 +169,56 @@ class ResourceStateTracker:
             alerts=alerts
         )
         
-        # 히스토리에 추가
-        self.resource_snapshots[resource_id].append(snapshot)
+        # 히스토리에 추가 - 사용률은 링 버퍼에만 기록하고 보관용 스냅샷의 메트릭에서는 제외
+        # (반환하는 현재 스냅샷은 사용률을 포함한 전체 메트릭 유지)
+        if metrics:
+            history_metrics = dict(metrics)
+            self._record_utilization(resource_id, history_metrics.pop('utilization', 0.0))
+            snapshot_for_history = replace(snapshot, metrics=history_metrics)
+        else:
+            snapshot_for_history = snapshot
+        self.resource_snapshots[resource_id].append(snapshot_for_history)
         
         return snapshot
         
+    def _record_utilization(self, resource_id: str, utilization: float):
+        """사용률 샘플을 리소스별 링 버퍼에 기록"""
+        times = self.utilization_times.get(resource_id)
+        if times is None:
+            times = self.utilization_times[resource_id] = np.empty(self.max_history, dtype=np.float64)
+            self.utilization_values[resource_id] = np.empty(self.max_history, dtype=np.float32)
+            
+        i = self.utilization_count[resource_id] % self.max_history
+        times[i] = self.env.now
+        self.utilization_values[resource_id][i] = utilization
+        self.utilization_count[resource_id] += 1
+        
+    def get_utilization_series(self, resource_id: str, hours: int = 24):
+        """
+        특정 리소스의 사용률 시계열을 시간순 NumPy 배열로 반환
+        
+        Returns:
+            (times, utilizations) 배열 쌍 (기록이 없으면 빈 배열)
+        """
+        count = self.utilization_count.get(resource_id, 0)
+        if count == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty
+            
+        times = self.utilization_times[resource_id]
+        values = self.utilization_values[resource_id]
+        if count > self.max_history:
+            # 링 버퍼가 한 바퀴 돈 경우 가장 오래된 위치부터 다시 정렬
+            start = count % self.max_history
+            times = np.roll(times, -start)
+            values = np.roll(values, -start)
+        else:
+            times = times[:count]
+            values = values[:count]
+            
+        mask = times >= self.env.now - (hours * 3600)
+        return times[mask], values[mask]
+        
     def _collect_resource_status(self, resource_obj: Any) -> Dict[str, Any]:
         """리소스 상태 정보 수집"""
         status = {}
@@ -161,38 +244,41 @@ class ResourceStateTracker:
             
         return status
         
-    def _collect_resource_metrics(self, resource_obj: Any) -> Dict[str, float]:
-        """리소스 메트릭 수집"""
-        metrics = {}
-        
+    # (메트릭 이름, 속성 이름, 메서드 여부) - 수집 순서 유지
+    _METRIC_SOURCES = (
         # Machine 특화 메트릭
-        if hasattr(resource_obj, 'get_utilization'):
-            metrics['utilization'] = resource_obj.get_utilization()
-        if hasattr(resource_obj, 'get_availability'):
-            metrics['availability'] = resource_obj.get_availability()
-        if hasattr(resource_obj, 'get_failure_rate'):
-            metrics['failure_rate'] = resource_obj.get_failure_rate()
-        if hasattr(resource_obj, 'total_processed'):
-            metrics['total_processed'] = resource_obj.total_processed
-        if hasattr(resource_obj, 'total_failures'):
-            metrics['total_failures'] = resource_obj.total_failures
-            
+        ('utilization', 'get_utilization', True),
+        ('availability', 'get_availability', True),
+        ('failure_rate', 'get_failure_rate', True),
+        ('total_processed', 'total_processed', False),
+        ('total_failures', 'total_failures', False),
         # Worker 특화 메트릭
-        if hasattr(resource_obj, 'total_tasks_completed'):
-            metrics['tasks_completed'] = resource_obj.total_tasks_completed
-        if hasattr(resource_obj, 'get_efficiency'):
-            metrics['efficiency'] = resource_obj.get_efficiency()
-            
+        ('tasks_completed', 'total_tasks_completed', False),
+        ('efficiency', 'get_efficiency', True),
         # Transport 특화 메트릭
-        if hasattr(resource_obj, 'total_transports'):
-            metrics['total_transports'] = resource_obj.total_transports
-        if hasattr(resource_obj, 'get_average_transport_time'):
-            metrics['avg_transport_time'] = resource_obj.get_average_transport_time()
-            
-        return metrics
+        ('total_transports', 'total_transports', False),
+        ('avg_transport_time', 'get_average_transport_time', True),
+    )
+    
+    def _build_metric_samplers(self, resource_obj: Any) -> List[tuple]:
+        """리소스가 제공하는 메트릭만 골라 수집 함수 목록을 생성 (매 추적마다 hasattr 반복 방지)"""
+        samplers = []
+        for metric_name, attr_name, is_method in self._METRIC_SOURCES:
+            if not hasattr(resource_obj, attr_name):
+                continue
+            if is_method:
+                samplers.append((metric_name, getattr(resource_obj, attr_name)))
+            else:
+                samplers.append((metric_name, partial(attrgetter(attr_name), resource_obj)))
+        return samplers
+        
+    def _collect_resource_metrics(self, resource_obj: Any) -> Dict[str, float]:
+        """리소스 메트릭 수집"""
+        return {name: sample() for name, sample in self._build_metric_samplers(resource_obj)}
         
-    def _collect_resource_alerts(self, resource_obj: Any) -> List[Dict[str, Any]]:
-        """리소스 관련 알림 수집"""
+    def _collect_resource_alerts(self, resource_obj: Any,
+                                 utilization: Optional[float] = None) -> List[Dict[str, Any]]:
+        """리소스 관련 알림 수집 (utilization이 주어지면 재계산하지 않음)"""
         alerts = []
         
         # 기계 고장 알림
@@ -205,8 +291,9 @@ class ResourceStateTracker:
             })
             
         # 가동률 임계값 알림
-        if hasattr(resource_obj, 'get_utilization'):
+        if utilization is None and hasattr(resource_obj, 'get_utilization'):
             utilization = resource_obj.get_utilization()
+        if utilization is not None:
             if utilization < 0.3:  # 30% 미만
                 alerts.append({
                     'type': 'low_utilization',
@@ -232,7 +319,7 @@ class ResourceStateTracker:
         return states
         
     def get_resource_history(self, resource_id: str, hours: int = 24) -> List[ResourceStateSnapshot]:
-        """특정 리소스의 히스토리 반환"""
+        """특정 리소스의 히스토리 반환 (사용률 이력은 get_utilization_series 사용)"""
         if resource_id not in self.resource_snapshots:
             return []
             
@@ -259,6 +346,11 @@ class ProcessPerformanceMonitor:
         self.process_registry[process_id] = process_obj
         print(f"[ReportManager] 프로세스 등록: {process_id}")
         
+    def register_processes(self, processes: Dict[str, Any]):
+        """여러 프로세스를 한 번에 등록 ({process_id: process_obj})"""
+        self.process_registry.update(processes)
+        print(f"[ReportManager] 프로세스 {len(processes)}개 일괄 등록")
+        
     def set_performance_threshold(self, threshold: PerformanceThreshold):
         """성능 임계값 설정"""
         self.performance_thresholds[threshold.metric_name] = threshold
@@ -456,28 +548,51 @@ class AlertSystem:
 class ReportManager:
     """모든 리포트 기능의 중앙 관리자"""
     
-    def __init__(self, env: simpy.Environment):
+    def __init__(self, env: simpy.Environment, snapshot_keep: int = 10,
+                 visualization_manager: Any = None):
         """
         ReportManager 초기화
         
         Args:
             env: SimPy 환경
+            snapshot_keep: 메모리에 보관할 최근 대시보드 스냅샷 수
+            visualization_manager: 공유할 VisualizationManager (None이면 첫 사용 시 생성)
         """
         self.env = env
         
+        # 최근 대시보드 스냅샷 (전체 이력은 NDJSON 파일로 스트리밍)
+        self.recent_snapshots: deque = deque(maxlen=snapshot_keep)
+        
         # 서브 컴포넌트 초기화
         self.resource_tracker = ResourceStateTracker(env)
         self.process_monitor = ProcessPerformanceMonitor(env)
         self.alert_system = AlertSystem(env)
         
-        # 시각화 관리자 초기화
-        self.visualization_manager = VisualizationManager()
+        # 통계 관리자 (선택적, 외부에서 주입)
+        self.stats_manager = None
+        
+        # 시각화 관리자 (matplotlib 로드 비용이 크므로 주입되지 않았으면 첫 사용 시 생성)
+        self._visualization_manager = visualization_manager
         
         # 기본 임계값 설정
         self._setup_default_thresholds()
         
         print(f"[시간 {self.env.now:.1f}] ReportManager 초기화 완료")
         
+    @property
+    def visualization_manager(self):
+        """시각화 관리자 (첫 접근 시 지연 로드)"""
+        if self._visualization_manager is None:
+            from src.utils.visualization import VisualizationManager
+            self._visualization_manager = VisualizationManager()
+        return self._visualization_manager
+        
+    def _viz_skipped(self) -> bool:
+        """ALBBA_SKIP_VIZ 설정 시 차트 생성을 건너뜀"""
+        if SKIP_VIZ:
+            print("[ReportManager] ALBBA_SKIP_VIZ=1 - 차트 생성을 건너뜁니다.")
+        return SKIP_VIZ
+        
     def _setup_default_thresholds(self):
         """기본 임계값 설정"""
         # 가동률 임계값
@@ -495,6 +610,17 @@ class ReportManager:
         """프로세스 등록"""
         self.process_monitor.register_process(process_id, process_obj)
         
+    def register_processes(self, processes: Union[Dict[str, Any], List[Any]]):
+        """
+        프로세스 일괄 등록
+        
+        Args:
+            processes: {process_id: process_obj} 딕셔너리 또는 process_id 속성을 가진 프로세스 목록
+        """
+        if not isinstance(processes, dict):
+            processes = {proc.process_id: proc for proc in processes}
+        self.process_monitor.register_processes(processes)
+        
     def collect_real_time_status(self) -> Dict[str, Any]:
         """실시간 상태 수집"""
         # 1. 모든 등록된 Resource의 현재 상태 수집
@@ -548,13 +674,15 @@ class ReportManager:
         return metrics
     
     def extract_resource_utilization_timeline(self, resource_ids: List[str] = None, 
-                                            hours: int = 24) -> Dict[str, List[tuple]]:
+                                            hours: int = 24,
+                                            bucket_size: float = None) -> Dict[str, List[tuple]]:
         """
         리소스들의 사용률 시계열 데이터를 추출
         
         Args:
             resource_ids: 특정 리소스 ID 리스트 (None이면 모든 리소스)
             hours: 몇 시간 전까지의 데이터를 가져올지
+            bucket_size: 지정 시 이 시간 간격별 평균으로 집계 (예: 60 = 시간 단위)
             
         Returns:
             {resource_id: [(time, utilization), ...]} 형태의 데이터
@@ -565,27 +693,31 @@ class ReportManager:
         target_resources = resource_ids if resource_ids else list(self.resource_tracker.resource_registry.keys())
         
         for resource_id in target_resources:
-            # 해당 리소스의 히스토리 가져오기
-            history = self.resource_tracker.get_resource_history(resource_id, hours)
-            
-            # 시간-사용률 쌍으로 변환
-            timeline_points = []
-            for snapshot in history:
-                if snapshot and snapshot.metrics:
-                    utilization = snapshot.metrics.get('utilization', 0.0)
-                    timeline_points.append((snapshot.timestamp, utilization))
-            
-            # 시간순으로 정렬
-            timeline_points.sort(key=lambda x: x[0])
-            timeline_data[resource_id] = timeline_points
+            # 링 버퍼에서 시간순 사용률 배열을 가져와 시간-사용률 쌍으로 변환
+            times, utilizations = self.resource_tracker.get_utilization_series(resource_id, hours)
+            if bucket_size and len(times):
+                times, utilizations = self._bucket_mean(times, utilizations, bucket_size)
+            timeline_data[resource_id] = list(zip(times.tolist(), utilizations.tolist()))
             
         return timeline_data
     
+    @staticmethod
+    def _bucket_mean(times: np.ndarray, values: np.ndarray, bucket_size: float):
+        """시간 구간별 평균 (np.bincount로 합계/개수를 한 번에 계산, 빈 구간 제외)"""
+        bucket = (times // bucket_size).astype(np.int64)
+        first = bucket.min()
+        bucket -= first
+        counts = np.bincount(bucket)
+        sums = np.bincount(bucket, weights=values)
+        filled = counts > 0
+        return (np.flatnonzero(filled) + first) * float(bucket_size), sums[filled] / counts[filled]
+    
     def generate_utilization_timeline_chart(self, resource_ids: List[str] = None,
                                           hours: int = 24, 
                                           save_path: str = None,
                                           title: str = None,
-                                          show_chart: bool = True) -> str:
+                                          show_chart: bool = True,
+                                          bucket_size: float = None) -> str:
         """
         리소스 사용률 타임라인 차트 생성
         
@@ -595,12 +727,16 @@ class ReportManager:
             save_path: 저장 파일명 (선택적)
             title: 차트 제목 (선택적)
             show_chart: 차트 화면 표시 여부
+            bucket_size: 지정 시 이 시간 간격별 평균 사용률로 표시 (선택적)
             
         Returns:
             저장된 파일 경로 (저장된 경우)
         """
+        if self._viz_skipped():
+            return None
+            
         # 시계열 데이터 추출
-        timeline_data = self.extract_resource_utilization_timeline(resource_ids, hours)
+        timeline_data = self.extract_resource_utilization_timeline(resource_ids, hours, bucket_size)
         
         if not timeline_data:
             print("[ReportManager] 표시할 사용률 데이터가 없습니다.")
@@ -656,6 +792,9 @@ class ReportManager:
         Returns:
             저장된 파일 경로 (저장된 경우)
         """
+        if self._viz_skipped():
+            return None
+            
         # 현재 사용률 데이터 수집
         current_utilization = self._calculate_resource_utilization()
         
@@ -692,7 +831,8 @@ class ReportManager:
     
     def compare_resource_utilization_trends(self, resource_ids: List[str], 
                                           hours: int = 24,
-                                          save_path: str = None) -> str:
+                                          save_path: str = None,
+                                          bucket_size: float = None) -> str:
         """
         특정 리소스들의 사용률 트렌드 비교 차트 생성
         
@@ -700,11 +840,15 @@ class ReportManager:
             resource_ids: 비교할 리소스 ID 리스트
             hours: 분석 시간 범위
             save_path: 저장 파일명
+            bucket_size: 지정 시 이 시간 간격별 평균 사용률로 비교
             
         Returns:
             저장된 파일 경로
         """
-        timeline_data = self.extract_resource_utilization_timeline(resource_ids, hours)
+        if self._viz_skipped():
+            return None
+            
+        timeline_data = self.extract_resource_utilization_timeline(resource_ids, hours, bucket_size)
         
         if not timeline_data:
             print("[ReportManager] 비교할 데이터가 없습니다.")
@@ -794,6 +938,70 @@ class ReportManager:
         
         return dashboard_data
         
+    def start_snapshot_stream(self, snap_path: str, interval: float = 100.0):
+        """
+        대시보드 스냅샷을 주기적으로 NDJSON 파일에 기록하는 SimPy 프로세스 시작
+        
+        스냅샷을 메모리에 모두 쌓지 않고 한 줄씩 바로 파일에 추가하므로
+        실행 시간이 길어져도 메모리 사용량은 최근 스냅샷 몇 개로 제한됩니다.
+        첫 줄은 전체 대시보드이고 이후 줄에는 직전 스냅샷 대비 값이 바뀐 최상위 항목만 기록합니다
+        (load_snapshots가 순서대로 덮어써 전체 스냅샷으로 복원).
+        
+        Args:
+            snap_path: 스냅샷을 추가 기록할 NDJSON 파일 경로
+            interval: 스냅샷 간격 (시뮬레이션 시간)
+            
+        Returns:
+            simpy.Process: 모니터링 프로세스
+        """
+        return self.env.process(self._snapshot_stream_loop(snap_path, interval))
+        
+    def _snapshot_stream_loop(self, snap_path: str, interval: float):
+        """스냅샷 스트리밍 루프 (내부 메서드)"""
+        previous = None
+        last_digest = None
+        with open(snap_path, 'ab') as f:
+            while True:
+                dashboard = self.generate_real_time_dashboard()
+                self.recent_snapshots.append(dashboard)
+                
+                # 시간 항목을 뺀 내용의 해시가 직전과 같으면(유휴 구간) 항목별 비교 없이 시간만 기록
+                content = {key: value for key, value in dashboard.items() if key not in self._SNAPSHOT_TIME_KEYS}
+                digest = hashlib.blake2b(_dumps_json_line(content), digest_size=8).digest()
+                if previous is None:
+                    record = dashboard
+                elif digest == last_digest:
+                    record = {key: dashboard[key] for key in self._SNAPSHOT_TIME_KEYS}
+                else:
+                    record = self._diff_dashboard(previous, dashboard)
+                    
+                f.write(_dumps_json_line(record))
+                f.flush()
+                previous = dashboard
+                last_digest = digest
+                yield self.env.timeout(interval)
+                
+    # 매 스냅샷마다 값이 바뀌는 시간 항목 (중복 판정에서 제외)
+    _SNAPSHOT_TIME_KEYS = ('timestamp', 'simulation_time')
+                
+    @staticmethod
+    def _diff_dashboard(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """직전 대시보드 대비 값이 바뀐 최상위 항목만 추출"""
+        return {key: value for key, value in current.items() if previous.get(key) != value}
+                
+    @staticmethod
+    def load_snapshots(snap_path: str) -> List[Dict[str, Any]]:
+        """NDJSON 스냅샷 파일을 전체 스냅샷 리스트로 복원 (JSON 배열이 필요한 경우에만 사용)"""
+        loads = orjson.loads if orjson is not None else json.loads
+        snapshots = []
+        state: Dict[str, Any] = {}
+        with open(snap_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    state = {**state, **loads(line)}
+                    snapshots.append(state)
+        return snapshots
+        
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """종합 성능 리포트 생성"""
         report = {
@@ -826,7 +1034,8 @@ class ReportManager:
             'resource_id': resource_id,
             'current_state': snapshot.__dict__,
             'historical_data': [snap.__dict__ for snap in history],
-            'trend_analysis': self._analyze_resource_trend(history),
+            'trend_analysis': self._analyze_resource_trend(
+                self.resource_tracker.get_utilization_series(resource_id, hours=24)[1]),
             'performance_score': self._calculate_resource_performance_score(snapshot)
         }
         
@@ -845,20 +1054,30 @@ class ReportManager:
         }
         
     def export_data(self, format: ExportFormat, data: Dict[str, Any] = None, 
-                   filename: str = None) -> str:
-        """데이터 내보내기"""
+                   filename: str = None, timestamp: str = None) -> str:
+        """데이터 내보내기 (timestamp: 같은 실행의 로그 파일과 맞출 파일 이름 시각, 선택적)"""
         if data is None:
             data = self.generate_comprehensive_report()
             
         if filename is None:
-            timestamp = int(time.time())
+            if timestamp is None:
+                timestamp = int(time.time())
             filename = f"manufacturing_report_{timestamp}"
             
         try:
             if format == ExportFormat.JSON:
                 filepath = f"{filename}.json"
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+                if orjson is not None:
+                    # orjson은 UTF-8 바이트를 바로 반환하므로 바이너리 모드로 한 번에 기록
+                    with open(filepath, 'wb') as f:
+                        f.write(orjson.dumps(
+                            data, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                        ))
+                else:
+                    # json.dump는 조각마다 write를 호출하므로 문자열로 만든 뒤 한 번에 기록
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(json.dumps(data, ensure_ascii=False, indent=2, default=str))
                     
             elif format == ExportFormat.CSV:
                 filepath = f"{filename}.csv"
@@ -886,6 +1105,34 @@ class ReportManager:
             print(f"[ReportManager] 데이터 내보내기 실패: {e}")
             return None
             
+    def export_reports(self, formats: List[ExportFormat], data: Dict[str, Any] = None,
+                       filename: str = None, timestamp: str = None) -> List[str]:
+        """
+        여러 형식으로 한 번에 내보내기
+        
+        리포트는 한 번만 생성하고, 형식별 파일 쓰기는 스레드에서 동시에 수행합니다
+        (디스크 쓰기 중에는 GIL이 풀리므로 전체 시간이 가장 느린 파일 하나 수준으로 줄어듦).
+        
+        Args:
+            formats: 내보낼 형식 목록
+            data: 내보낼 데이터 (None이면 종합 리포트 생성)
+            filename: 확장자를 제외한 파일 이름 (None이면 타임스탬프로 생성)
+            timestamp: 파일 이름에 사용할 타임스탬프 (선택적)
+            
+        Returns:
+            형식 순서대로 저장된 파일 경로 목록 (실패한 형식은 None)
+        """
+        if data is None:
+            data = self.generate_comprehensive_report()
+            
+        if filename is None:
+            if timestamp is None:
+                timestamp = int(time.time())
+            filename = f"manufacturing_report_{timestamp}"
+            
+        with ThreadPoolExecutor(max_workers=max(len(formats), 1)) as executor:
+            return list(executor.map(lambda fmt: self.export_data(fmt, data, filename), formats))
+            
     # === 내부 헬퍼 메서드들 ===
     
     def _analyze_bottlenecks(self, resource_states: Dict, process_performance: Dict) -> List[Dict[str, Any]]:
@@ -917,10 +1164,11 @@ class ReportManager:
                 
         return bottlenecks
         
-    def _calculate_resource_utilization(self) -> Dict[str, float]:
-        """자원 가동률 계산"""
+    def _calculate_resource_utilization(self, resource_states: Dict = None) -> Dict[str, float]:
+        """자원 가동률 계산 (이미 수집한 상태가 있으면 재수집하지 않음)"""
         utilization = {}
-        resource_states = self.resource_tracker.get_all_resource_states()
+        if resource_states is None:
+            resource_states = self.resource_tracker.get_all_resource_states()
         
         for resource_id, state in resource_states.items():
             if state and 'metrics' in state.__dict__:
@@ -1100,7 +1348,7 @@ class ReportManager:
     def _generate_resource_analysis(self) -> Dict[str, Any]:
         """리소스 분석 생성"""
         resource_states = self.resource_tracker.get_all_resource_states()
-        utilization = self._calculate_resource_utilization()
+        utilization = self._calculate_resource_utilization(resource_states)
         
         return {
             'resource_count': len(resource_states),
@@ -1114,17 +1362,28 @@ class ReportManager:
         """프로세스 분석 생성"""
         process_performance = self.process_monitor.get_all_process_performance()
         
-        throughputs = {pid: perf.throughput for pid, perf in process_performance.items() if perf}
-        cycle_times = {pid: perf.cycle_time for pid, perf in process_performance.items() if perf}
+        # 프로세스 성능을 한 번만 순회하며 모든 분석 항목을 채움
+        throughputs = {}
+        cycle_times = {}
+        bottleneck_processes = []
+        idle_processes = []
+        for pid, perf in process_performance.items():
+            if not perf:
+                continue
+            throughputs[pid] = perf.throughput
+            cycle_times[pid] = perf.cycle_time
+            status = perf.current_status
+            if status == "출력_버퍼_가득참":
+                bottleneck_processes.append(pid)
+            elif status == "대기":
+                idle_processes.append(pid)
         
         return {
             'process_count': len(process_performance),
             'throughput_analysis': throughputs,
             'cycle_time_analysis': cycle_times,
-            'bottleneck_processes': [pid for pid, perf in process_performance.items() 
-                                   if perf and perf.current_status == "출력_버퍼_가득참"],
-            'idle_processes': [pid for pid, perf in process_performance.items() 
-                             if perf and perf.current_status == "대기"]
+            'bottleneck_processes': bottleneck_processes,
+            'idle_processes': idle_processes
         }
         
     def _generate_recommendations(self) -> List[Dict[str, Any]]:
@@ -1160,13 +1419,13 @@ class ReportManager:
             
         return recommendations
         
-    def _analyze_resource_trend(self, history: List[ResourceStateSnapshot]) -> Dict[str, Any]:
-        """리소스 트렌드 분석"""
-        if len(history) < 2:
+    def _analyze_resource_trend(self, utilizations: np.ndarray) -> Dict[str, Any]:
+        """리소스 트렌드 분석 (시간순 가동률 배열 기준)"""
+        if len(utilizations) < 2:
             return {'trend': 'insufficient_data'}
             
         # 가동률 트렌드 분석
-        utilizations = [snap.metrics.get('utilization', 0) for snap in history]
+        utilizations = utilizations.tolist()
         
         if len(utilizations) >= 2:
             trend = 'increasing' if utilizations[-1] > utilizations[0] else 'decreasing'
@@ -1380,17 +1639,18 @@ class ReportManager:
 
 # === 편의를 위한 팩토리 함수 ===
 
-def create_report_manager(env: simpy.Environment) -> ReportManager:
+def create_report_manager(env: simpy.Environment, visualization_manager: Any = None) -> ReportManager:
     """
     ReportManager 생성 팩토리 함수
     
     Args:
         env: SimPy 환경
+        visualization_manager: 여러 리포트 관리자가 공유할 VisualizationManager (선택적)
         
     Returns:
         ReportManager: 설정된 리포트 관리자
     """
-    return ReportManager(env)
+    return ReportManager(env, visualization_manager=visualization_manager)
     
 
 def setup_default_alert_callbacks(report_manager: ReportManager):
@@ -1407,6 +1667,6 @@ def setup_default_alert_callbacks(report_manager: ReportManager):
             'info': 'ℹ️'
         }
         emoji = severity_emoji.get(alert['severity'], '📋')
-        print(f"{emoji} [Alert] {alert['message']} (Component: {alert.get('component_id', 'Unknown')})")
+        LOG.info("%s [Alert] %s (Component: %s)", emoji, alert['message'], alert.get('component_id', 'Unknown'))
         
     report_manager.alert_system.register_alert_callback(print_alert)
\ No newline at end of file
@@ -105,6 +105,7 @@ class AdvancedResourceManager:
         # TransportProcess 관리
         self.transport_processes: Dict[str, Any] = {}  # transport_id -> TransportProcess 매핑
         self.transport_queue: List[Dict[str, Any]] = []  # 운송 요청 대기열
+        self._transport_info_cache = None  # 상태 조회용 정적 정보 캐시 (등록/해제 시 무효화)
         
     def register_resource(self, resource_id: str, capacity: int, resource_type: ResourceType = None, **metadata):
         """
@@ -140,8 +141,26 @@ class AdvancedResourceManager:
             transport_process: TransportProcess 인스턴스
         """
         self.transport_processes[transport_id] = transport_process
+        self._transport_info_cache = None
         print(f"[시간 {self.env.now:.1f}] TransportProcess 등록: {transport_id} (프로세스 ID: {transport_process.process_id})")
         
+    def register_transport_processes_bulk(self, transport_processes: Dict[str, Any]):
+        """
+        여러 TransportProcess를 한 번에 ResourceManager에 등록
+        
+        Args:
+            transport_processes: Transport 식별자 → TransportProcess 인스턴스 딕셔너리
+        """
+        if not transport_processes:
+            return
+        self.transport_processes.update(transport_processes)
+        self._transport_info_cache = None
+        now = self.env.now
+        print("\n".join(
+            f"[시간 {now:.1f}] TransportProcess 등록: {transport_id} (프로세스 ID: {process.process_id})"
+            for transport_id, process in transport_processes.items()
+        ))
+        
     def unregister_transport_process(self, transport_id: str):
         """
         TransportProcess 등록 해제
@@ -151,6 +170,7 @@ class AdvancedResourceManager:
         """
         if transport_id in self.transport_processes:
             del self.transport_processes[transport_id]
+            self._transport_info_cache = None
             print(f"[시간 {self.env.now:.1f}] TransportProcess 등록 해제: {transport_id}")
             return True
         return False
@@ -664,11 +684,18 @@ class AdvancedResourceManager:
         Returns:
             Dict: Transport 관리 상태 정보
         """
+        # 등록 정보(ID/이름)는 등록·해제 시에만 바뀌므로 캐시하고, 상태/경로만 매번 조회
+        if self._transport_info_cache is None:
+            self._transport_info_cache = [
+                (transport_id, transport_process, transport_process.process_id, transport_process.process_name)
+                for transport_id, transport_process in self.transport_processes.items()
+            ]
+        
         transport_info = {}
-        for transport_id, transport_process in self.transport_processes.items():
+        for transport_id, transport_process, process_id, process_name in self._transport_info_cache:
             transport_info[transport_id] = {
-                'process_id': transport_process.process_id,
-                'process_name': transport_process.process_name,
+                'process_id': process_id,
+                'process_name': process_name,
                 'status': getattr(transport_process, 'transport_status', 'unknown'),
                 'route': getattr(transport_process, 'route', None)
             }
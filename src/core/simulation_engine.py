@@ -1,6 +1,9 @@
 import simpy
+from contextlib import nullcontext
 from typing import Optional, Callable, Dict, Any
 
+from src.utils.log_util import buffered_stdout
+
 
 class SimulationEngine:
     """SimPy 기반 시뮬레이션 엔진 클래스입니다. 시뮬레이션의 실행 및 관리를 담당합니다."""
@@ -17,6 +20,7 @@ class SimulationEngine:
         self.processes = []  # 실행 중인 프로세스 목록
         self.resources = {}  # 등록된 리소스들
         self.random_seed = random_seed  # 랜덤 시드
+        self.periodic_callbacks = {}  # 주기·위상별 반복 콜백 목록 {(주기, 위상): [핸들, ...]}
         
         if random_seed is not None and isinstance(random_seed, (int, float, str, bytes, bytearray)):
             import random
@@ -33,6 +37,92 @@ class SimulationEngine:
         self.processes.append(process)
             
         return process
+
+    def schedule(self, delay: float, callback: Callable, *args) -> list:
+        """콜백을 delay 시간 뒤에 실행하도록 예약합니다.
+        
+        SimPy 프로세스(generator)를 만들지 않고 SimPy 이벤트 힙(heapq 기반,
+        (시간, 우선순위, 순번) 순 정렬)에 타임아웃 이벤트를 직접 등록하므로 단순 콜백에 적합합니다.
+        동일 시간의 콜백은 등록 순서대로 결정적으로 실행됩니다.
+        
+        Args:
+            delay (float): 현재 시간 기준 지연 시간
+            callback: 실행할 함수
+            *args: 콜백에 전달할 인자들
+            
+        Returns:
+            list: 예약 핸들 (cancel_scheduled에 전달하여 취소 가능)
+        """
+        handle = [callback, args]
+
+        def _fire(_event):
+            if handle[0] is not None:
+                handle[0](*handle[1])
+
+        self.env.timeout(delay).callbacks.append(_fire)
+        return handle
+
+    def cancel_scheduled(self, handle: list):
+        """schedule로 예약한 콜백을 취소합니다.
+        
+        힙에서 이벤트를 제거하지 않고 핸들만 무효화하여, 실행 시점에 건너뜁니다 (지연 삭제).
+        
+        Args:
+            handle (list): schedule이 반환한 예약 핸들
+        """
+        handle[0] = None
+        
+    def add_periodic(self, callback: Callable, period: float, *args) -> list:
+        """콜백을 일정 주기마다 반복 실행하도록 등록합니다.
+        
+        첫 실행은 등록 시점으로부터 period 뒤이고, 이후 period마다 반복됩니다.
+        주기와 위상(등록 시점 % period)이 같은 콜백들은 하나의 틱 이벤트에 묶여 한꺼번에
+        실행되므로, 주기적 작업이 많아도 틱마다 이벤트 힙에는 (주기, 위상)당 하나의 이벤트만 들어갑니다.
+        예: t=0에 주기 10으로 등록한 콜백은 t=10, 20, ...에, t=7에 등록한 콜백은 t=17, 27, ...에 실행됩니다.
+        
+        Args:
+            callback: 주기마다 실행할 함수
+            period (float): 실행 주기 (0보다 커야 함)
+            *args: 콜백에 전달할 인자들
+            
+        Returns:
+            list: 등록 핸들 (cancel_scheduled에 전달하여 해제 가능)
+            
+        Raises:
+            ValueError: period가 0 이하인 경우
+        """
+        if period <= 0:
+            raise ValueError(f"반복 주기는 0보다 커야 합니다: {period}")
+        
+        now = self.env.now
+        # 핸들: [콜백, 인자, 첫 실행 시간]
+        handle = [callback, args, now + period]
+        key = (period, now % period)
+        group = self.periodic_callbacks.get(key)
+        if group is None:
+            # 해당 (주기, 위상)의 첫 콜백이면 틱 이벤트 시작
+            group = self.periodic_callbacks[key] = []
+            self.schedule(period, self._run_periodic_tick, key, group)
+        group.append(handle)
+        return handle
+
+    def _run_periodic_tick(self, key: tuple, group: list):
+        """같은 (주기, 위상)의 콜백들을 일괄 실행하고 다음 틱을 예약합니다."""
+        # 해제된 핸들은 이번 틱에서 정리
+        group[:] = [handle for handle in group if handle[0] is not None]
+        if self.periodic_callbacks.get(key) is not group:
+            return  # reset 등으로 그룹이 교체된 경우
+        if not group:
+            del self.periodic_callbacks[key]
+            return
+        period = key[0]
+        # 같은 시각에 아직 실행되지 않은 틱이 있을 때 등록된 콜백은 첫 실행 시간까지 건너뜀
+        # (부동소수점 누적 오차는 허용)
+        due = self.env.now + period * 1e-9
+        for handle in tuple(group):
+            if handle[0] is not None and handle[2] <= due:
+                handle[0](*handle[1])
+        self.schedule(period, self._run_periodic_tick, key, group)
         
     def add_resource(self, name: str, resource: simpy.Resource):
         """시뮬레이션에 리소스를 등록합니다.
@@ -54,18 +144,24 @@ class SimulationEngine:
         """
         return self.resources.get(name)
         
-    def run(self, until: Optional[float] = None):
+    def run(self, until: Optional[float] = None, buffered_output: bool = False):
         """시뮬레이션을 실행합니다.
         
+        배치 실행에는 기본 simpy.Environment를 사용하세요. simpy.RealtimeEnvironment는
+        벽시계 시간에 맞춰 대기하므로 대화형 데모 외에는 사용하지 않습니다.
+        
         Args:
             until (Optional[float]): 시뮬레이션 종료 시간. None이면 모든 프로세스가 끝날 때까지 실행
+            buffered_output (bool): True이면 실행 중 출력을 줄 단위로 flush 하지 않고 모아서 출력
         """
-        print(f"시뮬레이션이 시작되었습니다. (종료 시간: {until})")
-        try:
-            self.env.run(until=until)
-            print(f"시뮬레이션이 완료되었습니다. (최종 시간: {self.env.now})")
-        except KeyboardInterrupt:
-            print(f"시뮬레이션이 중단되었습니다. (현재 시간: {self.env.now})")
+        output_context = buffered_stdout() if buffered_output else nullcontext()
+        with output_context:
+            print(f"시뮬레이션이 시작되었습니다. (종료 시간: {until})")
+            try:
+                self.env.run(until=until)
+                print(f"시뮬레이션이 완료되었습니다. (최종 시간: {self.env.now})")
+            except KeyboardInterrupt:
+                print(f"시뮬레이션이 중단되었습니다. (현재 시간: {self.env.now})")
             
     def get_current_time(self) -> float:
         """현재 시뮬레이션 시간을 반환합니다.
@@ -80,5 +176,6 @@ class SimulationEngine:
         self.env = simpy.Environment()
         self.processes.clear()
         self.resources.clear()
+        self.periodic_callbacks.clear()
         
 
@@ -5,6 +5,7 @@ Flow 관련 기능은 별도의 Flow 모듈로 분리되었습니다.
 """
 
 from typing import List, Optional, Any, Union, Dict, Callable, Tuple, Generator
+from collections.abc import Mapping
 from abc import ABC, abstractmethod
 import uuid
 import simpy
@@ -112,7 +113,7 @@ class BaseProcess(ABC):
         # 자원 설정 (인라인 처리)
         # 입력 자원 설정
         if input_resources is not None:
-            if isinstance(input_resources, dict):
+            if isinstance(input_resources, Mapping):
                 # 딕셔너리가 입력된 경우 자원별로 생성
                 for resource_name, quantity in input_resources.items():
                     input_resource = Resource(
@@ -122,7 +123,7 @@ class BaseProcess(ABC):
                         properties={"quantity": float(quantity), "unit": "단위"}
                     )
                     self.add_input_resource(input_resource)
-                print(f"[{self.process_name}] 입력자원 생성: {input_resources}")
+                print(f"[{self.process_name}] 입력자원 생성: {dict(input_resources)}")
             elif isinstance(input_resources, list):
                 # 기존 List[Resource] 처리
                 for resource in input_resources:
@@ -130,7 +131,7 @@ class BaseProcess(ABC):
         
         # 출력 자원 설정  
         if output_resources is not None:
-            if isinstance(output_resources, dict):
+            if isinstance(output_resources, Mapping):
                 # 딕셔너리가 입력된 경우 자원별로 생성
                 for resource_name, quantity in output_resources.items():
                     output_resource = Resource(
@@ -140,7 +141,7 @@ class BaseProcess(ABC):
                         properties={"quantity": float(quantity), "unit": "개"}
                     )
                     self.add_output_resource(output_resource)
-                print(f"[{self.process_name}] 출력자원 생성: {output_resources}")
+                print(f"[{self.process_name}] 출력자원 생성: {dict(output_resources)}")
             elif isinstance(output_resources, list):
                 # 기존 List[Resource] 처리
                 for resource in output_resources:
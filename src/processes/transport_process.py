@@ -9,6 +9,11 @@ import simpy
 from src.Resource.resource_base import Resource, ResourceRequirement, ResourceType
 
 
+def compute_cycle_time(loading_time: float, transport_time: float, unloading_time: float) -> float:
+    """운송 1회의 사이클 시간(적재 + 운송 + 하역)을 계산합니다. 대기 시간은 포함하지 않습니다."""
+    return loading_time + transport_time + unloading_time
+
+
 class TransportProcess(BaseProcess):
     """
     운송 공정을 정의하는 클래스입니다 (SimPy 기반).
@@ -75,7 +80,7 @@ class TransportProcess(BaseProcess):
             process_name=process_name,
             machines=machines, 
             workers=workers, 
-            processing_time=loading_time + transport_time + unloading_time,
+            processing_time=compute_cycle_time(loading_time, transport_time, unloading_time),
             failure_weight_machine=failure_weight_machine,
             failure_weight_worker=failure_weight_worker,
             input_resources=input_resources,
@@ -139,7 +144,7 @@ class TransportProcess(BaseProcess):
                 self.loading_time = 0.0
                 self.unloading_time = 0.0
                 # 총 처리 시간 재계산
-                self.processing_time = self.loading_time + self.transport_time + self.unloading_time
+                self.processing_time = compute_cycle_time(self.loading_time, self.transport_time, self.unloading_time)
                 print(f"[{self.process_name}] 컨베이어 최적화: 적재시간 {original_loading}→0, 하역시간 {original_unloading}→0")
                 print(f"[{self.process_name}] 운송시간만 사용: {self.transport_time}, 총 사이클 시간: {self.processing_time}")
     
@@ -469,7 +474,7 @@ class TransportProcess(BaseProcess):
             self.route = route
         
         # 총 처리 시간 재계산
-        self.processing_time = self.loading_time + self.transport_time + self.unloading_time
+        self.processing_time = compute_cycle_time(self.loading_time, self.transport_time, self.unloading_time)
         
         print(f"[{self.process_name}] Transport 설정 업데이트 완료")
         print(f"  - 적재: {self.loading_time}시간, 운송: {self.transport_time}시간")
@@ -498,7 +503,7 @@ class TransportProcess(BaseProcess):
             },
             'cycle_info': {
                 'total_cycle_time': self.processing_time,
-                'active_transport_time': self.loading_time + self.transport_time + self.unloading_time,
+                'active_transport_time': compute_cycle_time(self.loading_time, self.transport_time, self.unloading_time),
                 'idle_time': self.cooldown_time
             },
             'process_statistics': process_info
@@ -11,28 +11,85 @@
 - log_execution: 데코레이터
 - quick_log: 빠른 로그 저장
 - capture_output: 출력 캡처
+- buffered_stdout: 표준 출력 블록 버퍼링
 - save_output_to_md: MD 파일 저장
+- get_sim_logger: 시뮬레이션 진행 로그용 로거 (ALBBA_VERBOSE=1일 때만 출력)
+- record_chain_event / format_event_log: 공정 단계 이벤트를 LogContext 캡처 중에는 모아 두었다가 종료 시 한 번에 출력
 """
 
 import os
 import sys
 import io
 import time
+import logging
+import tempfile
 import traceback
 from datetime import datetime
 from contextlib import contextmanager
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import functools
 
 
+# 시뮬레이션 진행 중 이벤트마다 발생하는 상세 로그 출력 여부
+VERBOSE = os.environ.get("ALBBA_VERBOSE") == "1"
+
+# 공정 단계 이벤트 기록: (시뮬레이션 시간, 체인 ID, 단계 번호, 전체 단계 수, 공정명, 상태)
+# LogContext 캡처 중에만 이벤트마다 문자열을 만들지 않고 튜플만 쌓은 뒤, 컨텍스트 종료 시 한 번에 렌더링
+EVENT_LOG: List[Tuple[float, str, int, int, str, str]] = []
+_EVENT_STATUS_TEXT = {"start": "실행 중...", "done": "완료"}
+_event_capture_depth = 0  # 활성화된 LogContext 수 (0이면 이벤트를 바로 출력)
+
+
+def record_chain_event(now: float, chain_id: str, step: int, total: int, name: str, status: str) -> None:
+    """공정 단계 이벤트를 기록합니다.
+    
+    LogContext 캡처 중이면 EVENT_LOG에 튜플만 쌓아 두고, 캡처 중이 아니거나
+    VERBOSE(ALBBA_VERBOSE=1)이면 바로 출력합니다.
+    """
+    if _event_capture_depth and not VERBOSE:
+        EVENT_LOG.append((now, chain_id, step, total, name, status))
+        return
+    prefix = "\n" if status == "start" else ""
+    print(f"{prefix}[시간 {now:.1f}] [{step}/{total}] {name} {_EVENT_STATUS_TEXT.get(status, status)}")
+
+
+def format_event_log(events: Optional[List[Tuple]] = None) -> str:
+    """기록된 공정 단계 이벤트를 텍스트로 변환 (기본값: EVENT_LOG)"""
+    if events is None:
+        events = EVENT_LOG
+    status_text = _EVENT_STATUS_TEXT
+    return "".join([
+        f"[시간 {now:.1f}] [{step}/{total}] {name} {status_text.get(status, status)}\n"
+        for now, _, step, total, name, status in events
+    ])
+
+
+def _take_event_log(start: int = 0) -> List[Tuple]:
+    """EVENT_LOG에서 start 이후에 쌓인 이벤트를 꺼내고 기록에서 제거합니다."""
+    events = EVENT_LOG[start:]
+    del EVENT_LOG[start:]
+    return events
+
+
+def _append_event_log(content: str, events: List[Tuple]) -> str:
+    """이벤트가 있으면 렌더링해 내용 끝에 붙입니다."""
+    if not events:
+        return content
+    return f"{content}\n\n## 공정 단계 이벤트\n\n{format_event_log(events)}"
+
+
 class LogFormatter:
-    """로그 포맷터 - 다양한 형식으로 로그를 포맷팅"""
+    """로그 포맷터 - 다양한 형식으로 로그를 포맷팅
+    
+    각 형식은 본문 앞뒤에 붙는 머리말/꼬리말 쌍으로 정의됩니다.
+    큰 로그는 format_parts로 머리말/꼬리말만 받아 본문과 따로 기록하면 전체 문자열 복사를 피할 수 있습니다.
+    """
     
     def __init__(self, format_type: str = "basic_md"):
         self.format_type = format_type
     
-    def format_basic_md(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
-        """기본 마크다운 포맷"""
+    def _basic_md_parts(self, name: str, content: str, metadata: Dict[str, Any] = None) -> Tuple[str, str]:
+        """기본 마크다운 머리말/꼬리말"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         md_content = f"# {name}\n\n"
@@ -46,13 +103,11 @@ class LogFormatter:
         
         md_content += "## 로그 내용\n\n"
         md_content += "```\n"
-        md_content += content
-        md_content += "\n```\n"
         
-        return md_content
+        return md_content, "\n```\n"
     
-    def format_detailed_md(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
-        """상세 마크다운 포맷"""
+    def _detailed_md_parts(self, name: str, content: str, metadata: Dict[str, Any] = None) -> Tuple[str, str]:
+        """상세 마크다운 머리말/꼬리말"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         md_content = f"# {name} - 상세 로그\n\n"
@@ -68,17 +123,16 @@ class LogFormatter:
         
         md_content += "## 실행 로그\n\n"
         md_content += "```\n"
-        md_content += content
-        md_content += "\n```\n"
         
-        md_content += "## 요약\n\n"
-        md_content += f"- 실행 완료 시간: {timestamp}\n"
-        md_content += f"- 로그 길이: {len(content)} 문자\n"
+        footer = "\n```\n"
+        footer += "## 요약\n\n"
+        footer += f"- 실행 완료 시간: {timestamp}\n"
+        footer += f"- 로그 길이: {len(content)} 문자\n"
         
-        return md_content
+        return md_content, footer
     
-    def format_simple_text(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
-        """간단한 텍스트 포맷"""
+    def _simple_text_parts(self, name: str, content: str, metadata: Dict[str, Any] = None) -> Tuple[str, str]:
+        """간단한 텍스트 머리말/꼬리말"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         text_content = f"=== {name} ===\n"
@@ -91,21 +145,42 @@ class LogFormatter:
             text_content += "\n"
         
         text_content += "로그 내용:\n"
-        text_content += content
-        text_content += "\n"
         
-        return text_content
+        return text_content, "\n"
     
-    def format(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
-        """포맷 타입에 따라 로그 포맷팅"""
-        if self.format_type == "basic_md":
-            return self.format_basic_md(name, content, metadata)
-        elif self.format_type == "detailed_md":
-            return self.format_detailed_md(name, content, metadata)
+    def format_basic_md(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
+        """기본 마크다운 포맷"""
+        header, footer = self._basic_md_parts(name, content, metadata)
+        return header + content + footer
+    
+    def format_detailed_md(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
+        """상세 마크다운 포맷"""
+        header, footer = self._detailed_md_parts(name, content, metadata)
+        return header + content + footer
+    
+    def format_simple_text(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
+        """간단한 텍스트 포맷"""
+        header, footer = self._simple_text_parts(name, content, metadata)
+        return header + content + footer
+    
+    def format_parts(self, name: str, content: str, metadata: Dict[str, Any] = None) -> Tuple[str, str]:
+        """포맷 타입에 따른 머리말/꼬리말 (본문은 포함하지 않음)"""
+        if self.format_type == "detailed_md":
+            return self._detailed_md_parts(name, content, metadata)
         elif self.format_type == "simple_text":
-            return self.format_simple_text(name, content, metadata)
+            return self._simple_text_parts(name, content, metadata)
         else:
-            return self.format_basic_md(name, content, metadata)
+            return self._basic_md_parts(name, content, metadata)
+    
+    def format(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
+        """포맷 타입에 따라 로그 포맷팅"""
+        header, footer = self.format_parts(name, content, metadata)
+        return header + content + footer
+
+
+def make_timestamp() -> str:
+    """파일 이름용 타임스탬프 (한 실행에서 한 번 만들어 관련 파일들에 함께 전달)"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
 class LogManager:
@@ -120,16 +195,21 @@ class LogManager:
         # 로그 디렉토리 생성
         os.makedirs(log_dir, exist_ok=True)
     
-    def save_log(self, name: str, content: str, metadata: Dict[str, Any] = None) -> str:
-        """로그를 파일로 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_log(self, name: str, content: str, metadata: Dict[str, Any] = None,
+                 timestamp: Optional[str] = None) -> str:
+        """로그를 파일로 저장 (timestamp를 넘기면 같은 실행의 다른 파일과 같은 이름 시각 사용)"""
+        if timestamp is None:
+            timestamp = make_timestamp()
         filename = self.filename_pattern.format(name=name, timestamp=timestamp)
         filepath = os.path.join(self.log_dir, filename)
         
-        formatted_content = self.formatter.format(name, content, metadata)
+        # 본문(수 MB일 수 있음)을 머리말/꼬리말과 이어 붙이지 않고 따로 기록
+        header, footer = self.formatter.format_parts(name, content, metadata)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(formatted_content)
+        with open(filepath, 'wb') as f:
+            f.write(header.encode('utf-8'))
+            f.write(content.encode('utf-8'))
+            f.write(footer.encode('utf-8'))
         
         return filepath
 
@@ -138,28 +218,68 @@ class LogContext:
     """로그 컨텍스트 매니저 - with 문으로 로그 캡처"""
     
     def __init__(self, name: str, log_manager: Optional[LogManager] = None, 
-                 metadata: Dict[str, Any] = None):
+                 metadata: Dict[str, Any] = None, timestamp: Optional[str] = None):
         self.name = name
+        self.timestamp = timestamp
         self.log_manager = log_manager or LogManager()
         self.metadata = metadata or {}
         self.output_capture = None
         self.original_stdout = None
+        self.saved_fd = None
+        self.event_start = 0
     
     def __enter__(self):
-        """컨텍스트 진입 - 출력 캡처 시작"""
-        self.output_capture = io.StringIO()
+        """컨텍스트 진입 - 출력 캡처 시작
+        
+        sys.stdout 이 파일 디스크립터 1에 연결된 실제 스트림이면 fd 1을 임시 파일로
+        dup2 하여 print 가 StringIO 를 거치지 않고 바로 파일에 쓰이게 합니다.
+        그렇지 않은 경우(이미 다른 캡처 중 등)에는 StringIO 로 교체합니다.
+        캡처 중 발생한 공정 단계 이벤트는 EVENT_LOG에 모아 두었다가 종료 시 한 번에 출력합니다.
+        """
+        global _event_capture_depth
+        _event_capture_depth += 1
+        self.event_start = len(EVENT_LOG)
         self.original_stdout = sys.stdout
-        sys.stdout = self.output_capture
+        try:
+            stdout_fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            stdout_fd = None
+            
+        if stdout_fd == 1:
+            sys.stdout.flush()
+            self.output_capture = tempfile.TemporaryFile()
+            self.saved_fd = os.dup(1)
+            os.dup2(self.output_capture.fileno(), 1)
+        else:
+            self.output_capture = io.StringIO()
+            sys.stdout = self.output_capture
         return self
     
+    def _release_capture(self) -> str:
+        """원래 stdout 복원 후 캡처된 출력 반환"""
+        if self.saved_fd is None:
+            sys.stdout = self.original_stdout
+            captured_output = self.output_capture.getvalue()
+        else:
+            sys.stdout.flush()
+            os.dup2(self.saved_fd, 1)
+            os.close(self.saved_fd)
+            self.saved_fd = None
+            self.output_capture.seek(0)
+            encoding = getattr(self.original_stdout, 'encoding', None) or 'utf-8'
+            captured_output = self.output_capture.read().decode(encoding, errors='replace')
+        self.output_capture.close()
+        return captured_output
+    
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 종료 - 출력 캡처 및 로그 저장"""
-        # 원래 stdout 복원
-        sys.stdout = self.original_stdout
+        global _event_capture_depth
+        # 이 컨텍스트에서 쌓인 공정 단계 이벤트는 저장 성공 여부와 무관하게 먼저 꺼내 기록을 비움
+        _event_capture_depth -= 1
+        events = _take_event_log(self.event_start)
         
-        # 캡처된 출력 가져오기
-        captured_output = self.output_capture.getvalue()
-        self.output_capture.close()
+        # 원래 stdout 복원 및 캡처된 출력 가져오기
+        captured_output = self._release_capture()
         
         # 예외 정보 추가
         if exc_type:
@@ -169,8 +289,11 @@ class LogContext:
             error_info += f"**스택 트레이스**:\n```\n{traceback.format_exc()}\n```\n"
             captured_output += error_info
         
+        # 모아 둔 공정 단계 이벤트 추가
+        captured_output = _append_event_log(captured_output, events)
+        
         # 로그 저장
-        filepath = self.log_manager.save_log(self.name, captured_output, self.metadata)
+        filepath = self.log_manager.save_log(self.name, captured_output, self.metadata, self.timestamp)
         
         # 캡처된 출력을 다시 출력
         print(captured_output)
@@ -211,10 +334,65 @@ def capture_output():
         output_capture.close()
 
 
-def save_output_to_md(name: str, content: str, log_dir: str = "log") -> str:
+@contextmanager
+def buffered_stdout():
+    """표준 출력 블록 버퍼링 컨텍스트 매니저
+    
+    터미널 출력은 줄 단위로 flush 되므로 print 가 많은 시뮬레이션에서는 시스템 호출이
+    출력 줄 수만큼 발생합니다. 줄 단위 flush 없이 모아서 쓰고 종료 시 한 번에 flush 합니다.
+    sys.stdout 이 실제 스트림이 아닌 경우(예: capture_output 캡처 중)에는 그대로 둡니다.
+    """
+    original_stdout = sys.stdout
+    raw = getattr(original_stdout, 'buffer', None)
+    if raw is None:
+        yield original_stdout
+        return
+    
+    original_stdout.flush()
+    buffered = io.TextIOWrapper(raw, encoding=original_stdout.encoding, errors=original_stdout.errors,
+                                line_buffering=False, write_through=False)
+    try:
+        sys.stdout = buffered
+        yield buffered
+    finally:
+        buffered.flush()
+        buffered.detach()
+        sys.stdout = original_stdout
+
+
+def save_output_to_md(name: str, content: str, log_dir: str = "log",
+                      timestamp: Optional[str] = None) -> str:
     """출력을 MD 파일로 저장"""
     log_manager = LogManager(log_dir)
-    return log_manager.save_log(name, content)
+    return log_manager.save_log(name, content, timestamp=timestamp)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """기록 시점의 sys.stdout으로 출력하는 핸들러 (캡처 중 stdout 교체를 따라감)"""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def get_sim_logger(name: str) -> logging.Logger:
+    """시뮬레이션 진행 로그용 로거
+    
+    VERBOSE(ALBBA_VERBOSE=1)가 아니면 핸들러를 붙이지 않으므로 info 로그는
+    레벨 확인만 하고 바로 버려집니다. 메시지는 %-포맷 인자로 넘겨 문자열 생성도 생략되게 합니다.
+    """
+    logger = logging.getLogger(name)
+    if VERBOSE and not logger.handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
 
 
 # 편의 함수들